@@ -1,17 +1,19 @@
 from __future__ import annotations
 
 import ast
+from collections.abc import Iterable
+from collections.abc import Set as AbstractSet
 
 
 def get_decorator_names(decorator_list: list[ast.expr]) -> set[str]:
     names: set[str] = set()
     for dec in decorator_list:
-        if isinstance(dec, ast.Call):
-            names.add(dec.func.attr if isinstance(dec.func, ast.Attribute) else dec.func.id)  # type: ignore
-        elif isinstance(dec, ast.Name):
-            names.add(dec.id)
-        elif isinstance(dec, ast.Attribute):
-            names.add(dec.attr)
+        # @decorator(...), calls of other expressions (e.g. `@handlers["name"]()`) being ignored:
+        func = dec.func if isinstance(dec, ast.Call) else dec
+        if isinstance(func, ast.Name):
+            names.add(func.id)
+        elif isinstance(func, ast.Attribute):
+            names.add(func.attr)
 
     return names
 
@@ -29,17 +31,59 @@ def _has_pydantic_model_base(node: ast.ClassDef, *, include_root_model: bool) ->
     return False
 
 
-def _has_model_config(node: ast.ClassDef) -> bool:
+def _get_model_config(node: ast.ClassDef) -> ast.AnnAssign | ast.Assign | None:
     for stmt in node.body:
         if isinstance(stmt, ast.AnnAssign) and isinstance(stmt.target, ast.Name) and stmt.target.id == "model_config":
             # model_config: ... = ...
-            return True
+            return stmt
         if isinstance(stmt, ast.Assign) and any(
             t.id == "model_config" for t in stmt.targets if isinstance(t, ast.Name)
         ):
             # model_config = ...
-            return True
-    return False
+            return stmt
+    return None
+
+
+def _has_model_config(node: ast.ClassDef) -> bool:
+    return _get_model_config(node) is not None
+
+
+def get_model_config_arguments(node: ast.ClassDef) -> dict[str, ast.expr]:
+    """Get the configuration values explicitly set on a Pydantic model.
+
+    Values are taken from the class arguments (e.g. `class Model(BaseModel, frozen=True)`)
+    and from the `model_config` attribute, if set using a `ConfigDict` call or a dictionary literal.
+    """
+    arguments = {kw.arg: kw.value for kw in node.keywords if kw.arg is not None}
+
+    stmt = _get_model_config(node)
+    if stmt is None or stmt.value is None:
+        return arguments
+    if isinstance(stmt.value, ast.Call):
+        # model_config = ConfigDict(frozen=True)
+        arguments.update({kw.arg: kw.value for kw in stmt.value.keywords if kw.arg is not None})
+    elif isinstance(stmt.value, ast.Dict):
+        # model_config = {"frozen": True}
+        arguments.update(
+            {
+                key.value: value
+                for key, value in zip(stmt.value.keys, stmt.value.values)
+                if isinstance(key, ast.Constant) and isinstance(key.value, str)
+            }
+        )
+    return arguments
+
+
+def is_true(node: ast.expr | None) -> bool:
+    return isinstance(node, ast.Constant) and node.value is True
+
+
+def is_none(node: ast.expr | None) -> bool:
+    return isinstance(node, ast.Constant) and node.value is None
+
+
+def is_ellipsis(node: ast.expr | None) -> bool:
+    return isinstance(node, ast.Constant) and node.value is Ellipsis
 
 
 PYDANTIC_FIELD_ARGUMENTS = {
@@ -171,10 +215,36 @@ def is_pydantic_model(node: ast.ClassDef, *, include_root_model: bool = True) ->
     )
 
 
+DATACLASS_DECORATORS = {"dataclass", "pydantic_dataclass"}
+
+
 def is_dataclass(node: ast.ClassDef) -> bool:
     """Determine if a class is a dataclass."""
 
-    return bool({"dataclass", "pydantic_dataclass"} & get_decorator_names(node.decorator_list))
+    return bool(DATACLASS_DECORATORS & get_decorator_names(node.decorator_list))
+
+
+def get_dataclass_arguments(node: ast.ClassDef) -> dict[str, ast.expr]:
+    """Get the arguments passed to the dataclass decorator of a class, e.g. `@dataclass(slots=True)`."""
+    for dec in node.decorator_list:
+        if isinstance(dec, ast.Call) and any(is_function(dec, name) for name in DATACLASS_DECORATORS):
+            return {kw.arg: kw.value for kw in dec.keywords if kw.arg is not None}
+    return {}
+
+
+def has_slots(node: ast.ClassDef) -> bool:
+    """Determine if a dataclass defines slots, either using `@dataclass(slots=True)` or a `__slots__` attribute."""
+    if is_true(get_dataclass_arguments(node).get("slots")):
+        return True
+
+    for stmt in node.body:
+        if isinstance(stmt, ast.AnnAssign) and is_name(stmt.target, "__slots__"):
+            # __slots__: ... = ...
+            return True
+        if isinstance(stmt, ast.Assign) and any(is_name(t, "__slots__") for t in stmt.targets):
+            # __slots__ = ...
+            return True
+    return False
 
 
 def is_function(node: ast.Call, function_name: str) -> bool:
@@ -200,10 +270,267 @@ def extract_annotations(node: ast.expr) -> set[str]:
     if isinstance(node, ast.Subscript):
         # foo: dict[str, date]
         # foo: Annotated[list[date], ...]
-        if isinstance(node.slice, ast.Tuple):
-            for elt in node.slice.elts:
+        # foo: list[list[date]]
+        if is_name(node.value, "Literal"):
+            # Literal values (e.g. `Literal["a"]`) aren't annotations:
+            pass
+        elif is_name(node.value, "Annotated") and isinstance(node.slice, ast.Tuple):
+            # Metadata (e.g. string documentation) isn't part of the type:
+            for elt in node.slice.elts[:1]:
                 annotations |= extract_annotations(elt)
-        if isinstance(node.slice, ast.Name):
-            annotations.add(node.slice.id)
+        else:
+            annotations |= extract_annotations(node.slice)
+    if isinstance(node, ast.Tuple):
+        for elt in node.elts:
+            annotations |= extract_annotations(elt)
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        # foo: "date"
+        try:
+            annotations |= extract_annotations(ast.parse(node.value, mode="eval").body)
+        except (SyntaxError, ValueError):
+            # Python < 3.11 raises a `ValueError` for null bytes:
+            pass
 
     return annotations
+
+
+NEGATED_COMPARISONS: dict[type[ast.cmpop], type[ast.cmpop]] = {
+    ast.Lt: ast.GtE,
+    ast.LtE: ast.Gt,
+    ast.Gt: ast.LtE,
+    ast.GtE: ast.Lt,
+}
+
+FLIPPED_COMPARISONS: dict[type[ast.cmpop], type[ast.cmpop]] = {
+    ast.Lt: ast.Gt,
+    ast.LtE: ast.GtE,
+    ast.Gt: ast.Lt,
+    ast.GtE: ast.LtE,
+}
+
+# Native constraints matching a comparison that *fails* validation, e.g. `v < 0` -> `ge`:
+VALUE_CONSTRAINTS: dict[type[ast.cmpop], str] = {
+    ast.Lt: "ge",
+    ast.LtE: "gt",
+    ast.Gt: "le",
+    ast.GtE: "lt",
+}
+
+LENGTH_CONSTRAINTS: dict[type[ast.cmpop], str] = {
+    ast.Lt: "min_length",
+    ast.LtE: "min_length",
+    ast.Gt: "max_length",
+    ast.GtE: "max_length",
+}
+
+REGEX_FUNCTIONS = {"match", "fullmatch", "search"}
+
+
+def _is_value(node: ast.expr, value_name: str) -> bool:
+    return isinstance(node, ast.Name) and node.id == value_name
+
+
+def _is_static_bound(node: ast.expr, dynamic_names: AbstractSet[str]) -> bool:
+    if isinstance(node, ast.Constant):
+        # v < 0
+        return isinstance(node.value, (int, float)) and not isinstance(node.value, bool)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        # v < -1
+        return _is_static_bound(node.operand, dynamic_names)
+    if isinstance(node, ast.Name):
+        # v < MAX_VALUE
+        return node.id not in dynamic_names
+    if isinstance(node, ast.Attribute):
+        # v < constants.MAX_VALUE
+        return _is_static_bound(node.value, dynamic_names)
+    return False
+
+
+def _get_comparison_constraint(
+    left: ast.expr, op: ast.cmpop, right: ast.expr, value_name: str, dynamic_names: AbstractSet[str]
+) -> str | None:
+    op_type = type(op)
+    if op_type not in FLIPPED_COMPARISONS:
+        return None
+    if _is_static_bound(left, dynamic_names):
+        # 0 > v -> v < 0
+        left, right = right, left
+        op_type = FLIPPED_COMPARISONS[op_type]
+    if not _is_static_bound(right, dynamic_names):
+        return None
+
+    if _is_value(left, value_name):
+        return VALUE_CONSTRAINTS[op_type]
+    if (
+        isinstance(left, ast.Call)
+        and is_function(left, "len")
+        and len(left.args) == 1
+        and _is_value(left.args[0], value_name)
+    ):
+        return LENGTH_CONSTRAINTS[op_type]
+    return None
+
+
+def _get_compare_constraints(
+    test: ast.Compare, value_name: str, *, failing: bool, dynamic_names: AbstractSet[str]
+) -> list[str] | None:
+    if not failing:
+        # assert 0 <= v <= 10
+        if not all(type(op) in NEGATED_COMPARISONS for op in test.ops):
+            return None
+        ops = [NEGATED_COMPARISONS[type(op)]() for op in test.ops]
+    elif len(test.ops) == 1:
+        # if v < 0: raise ...
+        ops = test.ops
+    else:
+        # `if 0 <= v <= 10: raise ...` can't be expressed as native constraints
+        return None
+
+    constraints: list[str] = []
+    operands = [test.left, *test.comparators]
+    for left, op, right in zip(operands, ops, operands[1:]):
+        constraint = _get_comparison_constraint(left, op, right, value_name, dynamic_names)
+        if constraint is None:
+            return None
+        constraints.append(constraint)
+    return constraints
+
+
+def _is_regex_check(test: ast.expr, value_name: str) -> bool:
+    # re.match(r"...", v)
+    # PATTERN.fullmatch(v)
+    return (
+        isinstance(test, ast.Call)
+        and isinstance(test.func, ast.Attribute)
+        and test.func.attr in REGEX_FUNCTIONS
+        and any(_is_value(arg, value_name) for arg in test.args)
+    )
+
+
+def get_native_constraints(
+    test: ast.expr, value_name: str, *, failing: bool, dynamic_names: AbstractSet[str] = frozenset()
+) -> list[str] | None:
+    """Get the native constraints equivalent to a validation check, if any.
+
+    `test` is the condition of the check, and `failing` specifies whether the condition
+    being true makes the validation fail (e.g. `if v < 0: raise ...`) or pass (e.g. `assert v >= 0`).
+    `dynamic_names` are the names that can't be used as constraint bounds (e.g. the validator
+    parameters and local variables), in addition to `value_name`.
+    """
+    dynamic_names = {value_name, *dynamic_names}
+    if isinstance(test, ast.UnaryOp) and isinstance(test.op, ast.Not):
+        # if not v >= 0: raise ...
+        return get_native_constraints(test.operand, value_name, failing=not failing, dynamic_names=dynamic_names)
+
+    if isinstance(test, ast.BoolOp) and isinstance(test.op, ast.Or if failing else ast.And):
+        # if v < 0 or v > 10: raise ...
+        # assert v >= 0 and v <= 10
+        constraints: list[str] = []
+        for value in test.values:
+            value_constraints = get_native_constraints(value, value_name, failing=failing, dynamic_names=dynamic_names)
+            if value_constraints is None:
+                return None
+            constraints.extend(value_constraints)
+        return constraints
+
+    if isinstance(test, ast.Compare):
+        return _get_compare_constraints(test, value_name, failing=failing, dynamic_names=dynamic_names)
+
+    if not failing and _is_regex_check(test, value_name):
+        return ["pattern"]
+
+    return None
+
+
+def get_assigned_names(nodes: list[ast.stmt]) -> set[str]:
+    """Get the names assigned in a list of statements, including nested ones."""
+    return {
+        child.id
+        for node in nodes
+        for child in ast.walk(node)
+        if isinstance(child, ast.Name) and isinstance(child.ctx, ast.Store)
+    }
+
+
+MUTABLE_LITERALS = (ast.List, ast.Dict, ast.Set)
+CONTAINER_LITERALS = (ast.List, ast.Dict, ast.Set, ast.Tuple)
+
+
+def _get_literal_elements(node: ast.expr) -> list[ast.expr]:
+    if isinstance(node, ast.Dict):
+        return [elt for elt in [*node.keys, *node.values] if elt is not None]
+    if isinstance(node, (ast.List, ast.Set, ast.Tuple)):
+        return node.elts
+    return []
+
+
+def is_expensive_mutable_literal(node: ast.expr, *, max_size: int) -> bool:
+    """Determine if a default value is a mutable literal expensive to copy.
+
+    Such literals are either nested containers (e.g. `[[1, 2], [3, 4]]`), or containers
+    with more than `max_size` elements.
+    """
+    if not isinstance(node, MUTABLE_LITERALS):
+        return False
+
+    elements = _get_literal_elements(node)
+    if isinstance(node, ast.Dict):
+        size = len(node.values)
+    else:
+        size = len(elements)
+    return size > max_size or any(isinstance(elt, CONTAINER_LITERALS) for elt in elements)
+
+
+EMPTY_CONTAINER_FACTORIES = {"list", "dict", "set"}
+
+
+def get_lambda_factory(node: ast.expr) -> str | None:
+    """Get the builtin constructor equivalent to a lambda returning an empty container, if any."""
+    if not isinstance(node, ast.Lambda) or node.args.args or node.args.posonlyargs or node.args.kwonlyargs:
+        return None
+
+    if isinstance(node.body, ast.List) and not node.body.elts:
+        # lambda: []
+        return "list"
+    if isinstance(node.body, ast.Dict) and not node.body.keys:
+        # lambda: {}
+        return "dict"
+    if (
+        isinstance(node.body, ast.Call)
+        and isinstance(node.body.func, ast.Name)
+        and node.body.func.id in EMPTY_CONTAINER_FACTORIES
+        and not node.body.args
+        and not node.body.keywords
+    ):
+        # lambda: set()
+        return node.body.func.id
+    return None
+
+
+# Loops (including comprehensions) weigh more than calls, so that any loop exceeds the default threshold of 1:
+LOOP_NODES = (ast.For, ast.AsyncFor, ast.While, ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp)
+LOOP_COMPLEXITY = 2
+CALL_COMPLEXITY = 1
+
+
+def get_body_complexity(node: ast.FunctionDef | ast.AsyncFunctionDef) -> int:
+    """Get the complexity of the body of a function, from the number of loops, comprehensions and calls."""
+    complexity = 0
+    for stmt in node.body:
+        for child in ast.walk(stmt):
+            if isinstance(child, LOOP_NODES):
+                complexity += LOOP_COMPLEXITY
+            elif isinstance(child, ast.Call):
+                complexity += CALL_COMPLEXITY
+    return complexity
+
+
+def append_lines(path: str, lines: Iterable[str]) -> None:
+    """Append lines to a file, creating it if needed.
+
+    flake8 may run the plugin in multiple processes, so all the lines are written at once.
+    """
+    content = "".join(f"{line}\n" for line in lines)
+    if content:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(content)
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import ast
+import copy
+import hashlib
+import os
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from functools import cache
+
+from ._utils import append_lines
+from .errors import Error
+
+BODY_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
+
+def _normalize(node: ast.AST) -> str:
+    """Unparse a node without its location and, for compound statements, without its body.
+
+    This makes fingerprints stable when lines are shifted or when unrelated statements
+    are changed in the body of a class or function. Unlike `ast.dump`, the output of
+    `ast.unparse` doesn't depend on the fields added or omitted by each Python version.
+    """
+    if any(hasattr(node, field) for field in BODY_FIELDS):
+        node = copy.copy(node)
+        for field in BODY_FIELDS:
+            if hasattr(node, field):
+                setattr(node, field, [])
+    return ast.unparse(node)
+
+
+def _iter_nodes(tree: ast.AST) -> Iterator[tuple[ast.AST, str | None]]:
+    # Depth-first, without recursion as pathological files can be deeply nested:
+    stack: list[tuple[ast.AST, str | None]] = [(tree, None)]
+    while stack:
+        node, class_name = stack.pop()
+        yield node, class_name
+        if isinstance(node, ast.ClassDef):
+            class_name = node.name
+        stack.extend((child, class_name) for child in reversed(list(ast.iter_child_nodes(node))))
+
+
+def get_fingerprint(
+    filename: str, error_code: str, class_name: str | None, node: ast.AST | None, occurrence: int = 0
+) -> str:
+    normalized = _normalize(node) if node is not None else ""
+    key = "\0".join((os.path.normpath(filename), error_code, class_name or "", normalized, str(occurrence)))
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+
+def get_fingerprints(tree: ast.AST, filename: str, errors: Iterable[Error]) -> list[str]:
+    """Get the fingerprints of the errors, identifying them by their code, enclosing class and statement."""
+    errors = list(errors)
+    positions = {(error.lineno, error.col_offset) for error in errors}
+
+    located: dict[tuple[int, int], tuple[ast.AST | None, str | None]] = {}
+    for node, class_name in _iter_nodes(tree):
+        if not isinstance(node, (ast.stmt, ast.expr)):
+            continue
+        position = (node.lineno, node.col_offset)
+        if position in positions and position not in located:
+            # Statements are visited before their expressions, which share the same position:
+            located[position] = (node, class_name)
+
+    fingerprints: list[str] = []
+    occurrences: Counter[str] = Counter()
+    for error in errors:
+        located_node, class_name = located.get((error.lineno, error.col_offset), (None, None))
+        fingerprint = get_fingerprint(filename, error.error_code, class_name, located_node)
+        # Identical statements are told apart by their order, so that new duplicates are still reported:
+        occurrence = occurrences[fingerprint]
+        occurrences[fingerprint] += 1
+        if occurrence:
+            fingerprint = get_fingerprint(filename, error.error_code, class_name, located_node, occurrence)
+        fingerprints.append(fingerprint)
+    return fingerprints
+
+
+@cache
+def load_baseline(path: str) -> frozenset[str]:
+    """Load the fingerprints of a baseline file, once per process."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return frozenset(f.read().split())
+    except FileNotFoundError:
+        return frozenset()
+
+
+def write_baseline(path: str, fingerprints: Iterable[str]) -> None:
+    # Errors already recorded (e.g. if the baseline wasn't removed before regenerating it) aren't duplicated:
+    baseline = load_baseline(path)
+    append_lines(path, [fingerprint for fingerprint in fingerprints if fingerprint not in baseline])
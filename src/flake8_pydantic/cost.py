@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import ast
+from collections.abc import Callable, Container, Iterable, Iterator
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from ._utils import extract_annotations, get_decorator_names, is_function, is_name, is_none, is_true
+
+FIELD_COST = 1
+NESTED_MODEL_COST = 3
+UNION_MEMBER_COST = 2
+VALIDATOR_COST = 5
+COMPUTED_FIELD_COST = 3
+CONFIG_FLAG_COST = 10
+
+VALIDATOR_DECORATORS = {"field_validator", "model_validator"}
+
+
+@dataclass
+class ModelCost:
+    """The static validation cost estimation of a Pydantic model."""
+
+    name: str
+    lineno: int
+    fields: int = 0
+    nested_models: int = 0
+    union_members: int = 0
+    """The number of members of unions used without a discriminator."""
+    validators: int = 0
+    computed_fields: int = 0
+    config_flags: int = 0
+    """The number of costly configuration flags set, such as `validate_assignment`."""
+    field_costs: dict[str, tuple[int, int]] = field(default_factory=dict, repr=False, compare=False)
+    """The nested models and union members of each field, including inherited ones."""
+    method_kinds: dict[str, tuple[bool, bool]] = field(default_factory=dict, repr=False, compare=False)
+    """Whether each method is a validator and a computed field, including inherited ones."""
+
+    @property
+    def score(self) -> int:
+        return (
+            self.fields * FIELD_COST
+            + self.nested_models * NESTED_MODEL_COST
+            + self.union_members * UNION_MEMBER_COST
+            + self.validators * VALIDATOR_COST
+            + self.computed_fields * COMPUTED_FIELD_COST
+            + self.config_flags * CONFIG_FLAG_COST
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        del data["field_costs"], data["method_kinds"]
+        return {**data, "score": self.score}
+
+
+def _is_union(node: ast.expr) -> bool:
+    return (isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr)) or (
+        isinstance(node, ast.Subscript) and (is_name(node.value, "Union") or is_name(node.value, "Optional"))
+    )
+
+
+def _get_union_members(node: ast.expr) -> list[ast.expr]:
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+        # A | B | None
+        return [*_get_union_members(node.left), *_get_union_members(node.right)]
+    if isinstance(node, ast.Subscript) and is_name(node.value, "Union"):
+        # Union[A, B]
+        elts = node.slice.elts if isinstance(node.slice, ast.Tuple) else [node.slice]
+        return [member for elt in elts for member in _get_union_members(elt)]
+    if isinstance(node, ast.Subscript) and is_name(node.value, "Optional"):
+        # Optional[A]
+        return _get_union_members(node.slice)
+    return [node]
+
+
+def _iter_unions(node: ast.expr) -> Iterator[list[ast.expr]]:
+    if _is_union(node):
+        members = _get_union_members(node)
+        yield members
+        for member in members:
+            yield from _iter_unions(member)
+    elif isinstance(node, ast.Subscript):
+        # list[A | B]
+        yield from _iter_unions(node.slice)
+    elif isinstance(node, ast.Tuple):
+        for elt in node.elts:
+            yield from _iter_unions(elt)
+
+
+def _has_discriminator(stmt: ast.AnnAssign) -> bool:
+    calls = [stmt.value] if isinstance(stmt.value, ast.Call) else []
+    if (
+        isinstance(stmt.annotation, ast.Subscript)
+        and is_name(stmt.annotation.value, "Annotated")
+        and isinstance(stmt.annotation.slice, ast.Tuple)
+    ):
+        calls.extend(elt for elt in stmt.annotation.slice.elts[1:] if isinstance(elt, ast.Call))
+
+    return any(
+        is_function(call, "Discriminator")
+        or (is_function(call, "Field") and any(kw.arg == "discriminator" for kw in call.keywords))
+        for call in calls
+    )
+
+
+def estimate_model_cost(
+    node: ast.ClassDef,
+    *,
+    model_names: Container[str],
+    config: dict[str, ast.expr],
+    bases: Iterable[ModelCost] = (),
+    checkpoint: Callable[[], None] | None = None,
+) -> ModelCost:
+    """Estimate the validation cost of a Pydantic model from its class definition.
+
+    `model_names` are the names of the models known to be defined in the module, used to
+    detect nested models, and `config` is the configuration of the model, as recorded by the visitor.
+    Fields and methods are inherited from the costs of the `bases` models defined in the same module.
+    `checkpoint` is called before each statement of the class body, e.g. to enforce a time budget.
+    """
+    cost = ModelCost(name=node.name, lineno=node.lineno)
+    # The first bases take precedence, as in the method resolution order:
+    for base in reversed(list(bases)):
+        cost.field_costs.update(base.field_costs)
+        cost.method_kinds.update(base.method_kinds)
+
+    for stmt in node.body:
+        if checkpoint is not None:
+            checkpoint()
+        if isinstance(stmt, ast.AnnAssign) and isinstance(stmt.target, ast.Name):
+            if (
+                stmt.target.id.startswith("_")
+                or stmt.target.id == "model_config"
+                or is_name(stmt.annotation, "ClassVar")
+                or (isinstance(stmt.annotation, ast.Subscript) and is_name(stmt.annotation.value, "ClassVar"))
+            ):
+                # Private attributes and class variables aren't validated:
+                continue
+            nested_models = sum(
+                1 for name in extract_annotations(stmt.annotation) if name in model_names and name != node.name
+            )
+            union_members = 0
+            if not _has_discriminator(stmt):
+                for members in _iter_unions(stmt.annotation):
+                    # `None` is cheap to validate, and doesn't require a discriminator:
+                    width = sum(1 for member in members if not is_none(member))
+                    if width > 1:
+                        union_members += width
+            # Fields overridden from a base model replace the inherited ones:
+            cost.field_costs[stmt.target.id] = (nested_models, union_members)
+        elif isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            decorator_names = get_decorator_names(stmt.decorator_list)
+            cost.method_kinds[stmt.name] = (
+                bool(VALIDATOR_DECORATORS & decorator_names),
+                "computed_field" in decorator_names,
+            )
+
+    cost.fields = len(cost.field_costs)
+    cost.nested_models = sum(nested_models for nested_models, _ in cost.field_costs.values())
+    cost.union_members = sum(union_members for _, union_members in cost.field_costs.values())
+    cost.validators = sum(is_validator for is_validator, _ in cost.method_kinds.values())
+    cost.computed_fields = sum(is_computed_field for _, is_computed_field in cost.method_kinds.values())
+
+    if is_true(config.get("validate_assignment")):
+        cost.config_flags += 1
+    revalidate_instances = config.get("revalidate_instances")
+    if isinstance(revalidate_instances, ast.Constant) and revalidate_instances.value in {
+        "always",
+        "subclass-instances",
+    }:
+        cost.config_flags += 1
+
+    return cost
@@ -3,7 +3,7 @@ from __future__ import annotations
 import ast
 from abc import ABC
 from dataclasses import dataclass
-from typing import ClassVar
+from typing import Any, ClassVar
 
 from ._compat import Self
 
@@ -16,11 +16,12 @@ class Error(ABC):
     col_offset: int
 
     @classmethod
-    def from_node(cls, node: ast.stmt) -> Self:
-        return cls(lineno=node.lineno, col_offset=node.col_offset)
+    def from_node(cls, node: ast.stmt | ast.expr, **kwargs: Any) -> Self:
+        return cls(lineno=node.lineno, col_offset=node.col_offset, **kwargs)
 
     def as_flake8_error(self) -> tuple[int, int, str]:
-        return (self.lineno, self.col_offset, f"{self.error_code} {self.message}")
+        # Extra fields defined on subclasses can be referenced in the message:
+        return (self.lineno, self.col_offset, f"{self.error_code} {self.message.format_map(vars(self))}")
 
 
 class PYD001(Error):
@@ -56,3 +57,89 @@ class PYD006(Error):
 class PYD010(Error):
     error_code = "PYD010"
     message = "Usage of __pydantic_config__"
+
+
+class PYD100(Error):
+    error_code = "PYD100"
+    message = "Pydantic model created inside a function body"
+
+
+@dataclass
+class PYD101(Error):
+    error_code = "PYD101"
+    message = "Validator duplicates a native constraint, consider using `{field_call}`"
+    field_call: str
+
+
+class PYD102(Error):
+    error_code = "PYD102"
+    message = "Large or nested mutable default copied on every instantiation"
+
+
+@dataclass
+class PYD103(Error):
+    error_code = "PYD103"
+    message = "Lambda used as default factory, consider using `default_factory={factory}`"
+    factory: str
+
+
+class PYD104(Error):
+    error_code = "PYD104"
+    message = "Model rebuilt at import time"
+
+
+class PYD105(Error):
+    error_code = "PYD105"
+    message = "Forward reference requires a model rebuild"
+
+
+@dataclass
+class PYD106(Error):
+    error_code = "PYD106"
+    message = "Module defines more than {max_models} models, consider using `ConfigDict(defer_build=True)`"
+    max_models: int
+
+
+@dataclass
+class PYD107(Error):
+    error_code = "PYD107"
+    message = "Model validation cost estimated at {score}, above {max_cost}"
+    score: int
+    max_cost: int
+
+
+@dataclass
+class PYD108(Error):
+    error_code = "PYD108"
+    message = "Analysis of {filename} exceeded its budget during {phase}, consider excluding it"
+    filename: str
+    phase: str
+
+
+@dataclass
+class PYD109(Error):
+    error_code = "PYD109"
+    message = "`validate_call` used on {reason}"
+    reason: str
+
+
+class PYD110(Error):
+    error_code = "PYD110"
+    message = "Deep copy of a model instance in a loop, consider a shallow `model_copy(update=...)`"
+
+
+@dataclass
+class PYD111(Error):
+    error_code = "PYD111"
+    message = "Computed field {reason}"
+    reason: str
+
+
+class PYD112(Error):
+    error_code = "PYD112"
+    message = "Dataclass without slots"
+
+
+class PYD113(Error):
+    error_code = "PYD113"
+    message = "Assignment validated on every iteration, consider updating the model once"
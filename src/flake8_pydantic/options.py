@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Options:
+    """The options of the plugin, configurable through flake8."""
+
+    max_models_without_defer_build: int = 20
+    max_model_cost: int = 50
+    model_costs_file: str | None = None
+    baseline: str | None = None
+    update_baseline: bool = False
+    max_analysis_time: float | None = None
+    max_computed_field_complexity: int = 1
+    min_python_version: tuple[int, int] = (3, 9)
+    over_budget_file: str | None = None
@@ -1,22 +1,161 @@
 from __future__ import annotations
 
+import argparse
 import ast
+import json
+import re
 from collections.abc import Iterator
 from importlib.metadata import version
-from typing import Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
-from .visitor import Visitor
+from ._utils import append_lines
+from .baseline import get_fingerprints, load_baseline, write_baseline
+from .cost import ModelCost
+from .errors import PYD108
+from .options import Options
+from .visitor import AnalysisBudgetExceeded, Visitor
+
+if TYPE_CHECKING:
+    from flake8.options.manager import OptionManager  # type: ignore[import-untyped]
+
+
+def _parse_python_version(value: str) -> tuple[int, int]:
+    # The micro version (e.g. in '3.10.4') is ignored:
+    match = re.fullmatch(r"(\d+)\.(\d+)(?:\.\d+)?", value.strip())
+    if match is None:
+        raise argparse.ArgumentTypeError(f"expected a Python version such as '3.10', got {value!r}")
+    return int(match[1]), int(match[2])
 
 
 class Plugin:
     name = "flake8-pydantic"
     version = version(name)
 
-    def __init__(self, tree: ast.AST) -> None:
+    options: ClassVar[Options] = Options()
+
+    def __init__(self, tree: ast.AST, filename: str = "stdin") -> None:
         self._tree = tree
+        self._filename = filename
+
+    @classmethod
+    def add_options(cls, parser: OptionManager) -> None:
+        parser.add_option(
+            "--pyd-max-models-without-defer-build",
+            type=int,
+            default=Options.max_models_without_defer_build,
+            parse_from_config=True,
+            help="Number of models a module can define before PYD106 is emitted. (Default: %(default)s)",
+        )
+        parser.add_option(
+            "--pyd-max-model-cost",
+            type=int,
+            default=Options.max_model_cost,
+            parse_from_config=True,
+            help="Estimated validation cost of a model above which PYD107 is emitted. (Default: %(default)s)",
+        )
+        parser.add_option(
+            "--pyd-model-costs-file",
+            default=Options.model_costs_file,
+            parse_from_config=True,
+            help="File to append the estimated validation costs of the models to, as JSON lines.",
+        )
+        parser.add_option(
+            "--pyd-baseline",
+            default=Options.baseline,
+            parse_from_config=True,
+            help="Baseline file of the errors to ignore.",
+        )
+        parser.add_option(
+            "--pyd-update-baseline",
+            action="store_true",
+            default=Options.update_baseline,
+            help="Append the errors found to the baseline file, instead of ignoring them.",
+        )
+        parser.add_option(
+            "--pyd-max-analysis-time",
+            type=float,
+            default=Options.max_analysis_time,
+            parse_from_config=True,
+            help="Time budget (in seconds) for the analysis of a file, after which PYD108 is emitted.",
+        )
+        parser.add_option(
+            "--pyd-over-budget-file",
+            default=Options.over_budget_file,
+            parse_from_config=True,
+            help="File to append the names of the files exceeding their analysis budget to.",
+        )
+        parser.add_option(
+            "--pyd-max-computed-field-complexity",
+            type=int,
+            default=Options.max_computed_field_complexity,
+            parse_from_config=True,
+            help="Complexity of an uncached computed field above which PYD111 is emitted. (Default: %(default)s)",
+        )
+        parser.add_option(
+            "--pyd-min-python-version",
+            type=_parse_python_version,
+            default=".".join(map(str, Options.min_python_version)),
+            parse_from_config=True,
+            help="Minimum Python version supported by the checked code. (Default: %(default)s)",
+        )
+        # Opt-in rules:
+        parser.extend_default_ignore(["PYD112"])
+
+    @classmethod
+    def parse_options(cls, option_manager: OptionManager, options: argparse.Namespace, args: list[str]) -> None:
+        cls.options = Options(
+            max_models_without_defer_build=options.pyd_max_models_without_defer_build,
+            max_model_cost=options.pyd_max_model_cost,
+            model_costs_file=options.pyd_model_costs_file,
+            baseline=options.pyd_baseline,
+            update_baseline=options.pyd_update_baseline,
+            max_analysis_time=options.pyd_max_analysis_time,
+            over_budget_file=options.pyd_over_budget_file,
+            max_computed_field_complexity=options.pyd_max_computed_field_complexity,
+            min_python_version=options.pyd_min_python_version,
+        )
+        if cls.options.update_baseline and cls.options.baseline is None:
+            option_manager.parser.error("--pyd-update-baseline requires --pyd-baseline to be set")
+
+    def _dump_model_costs(self, model_costs: list[ModelCost]) -> None:
+        assert self.options.model_costs_file is not None
+        append_lines(
+            self.options.model_costs_file,
+            [json.dumps({"filename": self._filename, **cost.as_dict()}) for cost in model_costs],
+        )
+
+    def _record_over_budget(self) -> None:
+        assert self.options.over_budget_file is not None
+        append_lines(self.options.over_budget_file, [self._filename])
 
     def run(self) -> Iterator[tuple[int, int, str, type[Any]]]:
-        visitor = Visitor()
-        visitor.visit(self._tree)
-        for error in visitor.errors:
+        visitor = Visitor(self.options)
+        over_budget_error: PYD108 | None = None
+        try:
+            visitor.visit(self._tree)
+        except AnalysisBudgetExceeded as e:
+            over_budget_error = PYD108(lineno=1, col_offset=0, filename=self._filename, phase=e.phase)
+        except RecursionError:
+            # Pathologically deep input, e.g. an extremely deep annotation:
+            over_budget_error = PYD108(lineno=1, col_offset=0, filename=self._filename, phase=visitor.phase)
+
+        if over_budget_error is not None and self.options.over_budget_file is not None:
+            self._record_over_budget()
+
+        if self.options.model_costs_file is not None:
+            self._dump_model_costs(visitor.model_costs)
+
+        errors = visitor.errors
+        if self.options.baseline is not None and errors:
+            fingerprints = get_fingerprints(self._tree, self._filename, errors)
+            if self.options.update_baseline:
+                write_baseline(self.options.baseline, fingerprints)
+            else:
+                baseline = load_baseline(self.options.baseline)
+                errors = [error for error, fp in zip(errors, fingerprints) if fp not in baseline]
+
+        if over_budget_error is not None:
+            errors = [*errors, over_budget_error]
+
+        for error in errors:
             yield *error.as_flake8_error(), type(self)
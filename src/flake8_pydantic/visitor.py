@@ -1,31 +1,209 @@
 from __future__ import annotations
 
 import ast
+import time
 from collections import deque
-from typing import Literal
+from collections.abc import Callable
+from functools import wraps
+from typing import Any, Literal, TypeVar, cast
 
 from ._compat import TypeAlias
-from ._utils import extract_annotations, is_dataclass, is_function, is_name, is_pydantic_model
-from .errors import PYD001, PYD002, PYD003, PYD004, PYD005, PYD006, PYD010, Error
+from ._utils import (
+    extract_annotations,
+    get_assigned_names,
+    get_body_complexity,
+    get_decorator_names,
+    get_lambda_factory,
+    get_model_config_arguments,
+    get_native_constraints,
+    has_slots,
+    is_dataclass,
+    is_ellipsis,
+    is_expensive_mutable_literal,
+    is_function,
+    is_name,
+    is_none,
+    is_pydantic_model,
+    is_true,
+)
+from .cost import ModelCost, estimate_model_cost
+from .errors import (
+    PYD001,
+    PYD002,
+    PYD003,
+    PYD004,
+    PYD005,
+    PYD006,
+    PYD010,
+    PYD100,
+    PYD101,
+    PYD102,
+    PYD103,
+    PYD104,
+    PYD105,
+    PYD106,
+    PYD107,
+    PYD109,
+    PYD110,
+    PYD111,
+    PYD112,
+    PYD113,
+    Error,
+)
+from .options import Options
 
 ClassType: TypeAlias = Literal["pydantic_model", "dataclass", "other_class"]
+FunctionDef: TypeAlias = "ast.FunctionDef | ast.AsyncFunctionDef"
+
+CACHE_DECORATORS = {"cache", "lru_cache"}
+
+MUTABLE_DEFAULT_MAX_SIZE = 8
+
+DATACLASS_SLOTS_MIN_PYTHON_VERSION = (3, 10)
+
+MODEL_CONSTRUCTORS = {"model_construct", "model_validate", "model_validate_json", "model_validate_strings"}
+
+# Collections yielding their elements when iterated (unlike mappings, yielding their keys):
+ITERABLE_COLLECTIONS = {
+    "list",
+    "set",
+    "frozenset",
+    "tuple",
+    "deque",
+    "List",
+    "Set",
+    "FrozenSet",
+    "Tuple",
+    "Deque",
+    "Sequence",
+    "MutableSequence",
+    "AbstractSet",
+    "MutableSet",
+    "Collection",
+    "Iterable",
+    "Iterator",
+}
+
+_PhaseT = TypeVar("_PhaseT", bound=Callable[..., Any])
+
+
+class AnalysisBudgetExceeded(Exception):
+    """Raised when the analysis of a file exceeds the configured time budget."""
+
+    def __init__(self, phase: str) -> None:
+        super().__init__(f"Analysis time budget exceeded during {phase}")
+        self.phase = phase
+
+
+def analysis_phase(func: _PhaseT) -> _PhaseT:
+    """Mark a method of the visitor as an analysis phase, enforcing the time budget around it."""
+    phase = func.__name__.lstrip("_")
+
+    @wraps(func)
+    def wrapper(self: Visitor, *args: Any) -> Any:
+        # The time spent since the previous phase is spent traversing the AST:
+        self.check_deadline()
+        self.phase = phase
+        result = func(self, *args)
+        self.check_deadline()
+        self.phase = "traversal"
+        return result
+
+    return cast(_PhaseT, wrapper)
+
+
+def _is_after_field_validator(node: ast.FunctionDef) -> bool:
+    for dec in node.decorator_list:
+        if isinstance(dec, ast.Call) and is_function(dec, "field_validator"):
+            mode = next((kw.value for kw in dec.keywords if kw.arg == "mode"), None)
+            # Constraints are applied after validation against the type, so only 'after' validators are relevant:
+            return mode is None or (isinstance(mode, ast.Constant) and mode.value == "after")
+    return False
 
 
 class Visitor(ast.NodeVisitor):
-    def __init__(self) -> None:
+    def __init__(self, options: Options | None = None) -> None:
+        self.options = options or Options()
         self.errors: list[Error] = []
         self.class_stack: deque[ClassType] = deque()
+        self.function_stack: deque[FunctionDef] = deque()
+
+        self.class_scopes: deque[tuple[str, int]] = deque()
+        """The names of the classes being visited, with the number of functions enclosing them."""
+
+        self.module_classes: dict[str, ast.ClassDef] = {}
+        """The classes defined at the module level, by name."""
+
+        self.module_class_references: dict[str, set[str]] = {}
+        """The module classes referenced by the bases and annotations of each module class, computed when needed."""
+
+        self.module_models: list[ast.ClassDef] = []
+        """The Pydantic models defined at the module level, built at import time."""
+
+        self.model_configs: dict[str, dict[str, ast.expr]] = {}
+        """The configuration values of the Pydantic models defined in the module, including inherited ones."""
+
+        self.model_costs: list[ModelCost] = []
+        """The estimated validation costs of the Pydantic models defined in the module."""
+
+        self.model_costs_by_name: dict[str, ModelCost] = {}
+
+        self.deadline: float | None = None
+        """The time after which the analysis is stopped, if a time budget is configured."""
+
+        self.phase = "traversal"
+        """The current analysis phase, either the classification of a class, a check or the AST traversal."""
+
+        self.loop_depths: deque[int] = deque([0])
+        """The loop nesting depths (including comprehensions), for each function scope being visited."""
+
+        self.loop_call_names: set[str] = set()
+        """The names of the functions called inside loops in the module (a module-level call-site index)."""
+
+        self.validate_call_functions: list[FunctionDef] = []
+        """The functions decorated with `validate_call` in the module."""
+
+        self.model_variables: deque[dict[str, str]] = deque([{}])
+        """The variables known to be model instances, mapped to their model name, for each function scope."""
+
+        self.model_collections: deque[dict[str, str]] = deque([{}])
+        """The variables known to be collections of model instances (e.g. `list[Model]`), mapped to their model name."""
+
+    def check_deadline(self) -> None:
+        """Stop the analysis if the time budget is exhausted, blaming the current phase."""
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise AnalysisBudgetExceeded(self.phase)
+
+    @analysis_phase
+    def classify_class(self, node: ast.ClassDef) -> ClassType:
+        if is_pydantic_model(node) or any(
+            isinstance(base, ast.Name) and base.id in self.model_configs for base in node.bases
+        ):
+            return "pydantic_model"
+        if is_dataclass(node):
+            return "dataclass"
+        return "other_class"
 
     def enter_class(self, node: ast.ClassDef) -> None:
-        if is_pydantic_model(node):
-            self.class_stack.append("pydantic_model")
-        elif is_dataclass(node):
-            self.class_stack.append("dataclass")
-        else:
-            self.class_stack.append("other_class")
+        class_type = self.classify_class(node)
+        if class_type == "pydantic_model":
+            if not self.class_stack and not self.in_function:
+                self.module_models.append(node)
+            self.record_model_config(node)
+        self.class_stack.append(class_type)
+        self.class_scopes.append((node.name, len(self.function_stack)))
+
+    def record_model_config(self, node: ast.ClassDef) -> None:
+        config: dict[str, ast.expr] = {}
+        for base in node.bases:
+            if isinstance(base, ast.Name) and base.id in self.model_configs:
+                config.update(self.model_configs[base.id])
+        config.update(get_model_config_arguments(node))
+        self.model_configs[node.name] = config
 
     def leave_class(self) -> None:
         self.class_stack.pop()
+        self.class_scopes.pop()
 
     @property
     def current_class(self) -> ClassType | None:
@@ -33,6 +211,146 @@ class Visitor(ast.NodeVisitor):
             return None
         return self.class_stack[-1]
 
+    def enter_function(self, node: FunctionDef) -> None:
+        # Methods are defined in the body of the model itself, not in one of its functions:
+        method_model = (
+            self.class_scopes[-1][0]
+            if self.current_class == "pydantic_model" and self.class_scopes[-1][1] == len(self.function_stack)
+            else None
+        )
+        self.function_stack.append(node)
+        # The body of a function defined in a loop isn't executed by the loop:
+        self.loop_depths.append(0)
+        self.model_variables.append({})
+        self.model_collections.append({})
+        positional_args = [*node.args.posonlyargs, *node.args.args]
+        if method_model is not None and positional_args and positional_args[0].arg == "self":
+            # def method(self): ...
+            self.model_variables[-1]["self"] = method_model
+        for arg in [*node.args.posonlyargs, *node.args.args, *node.args.kwonlyargs]:
+            model_name = self.get_annotated_model(arg.annotation)
+            if model_name is not None:
+                # def func(model: Model): ...
+                self.model_variables[-1][arg.arg] = model_name
+            collection_model = self.get_annotated_collection_model(arg.annotation)
+            if collection_model is not None:
+                # def func(models: list[Model]): ...
+                self.model_collections[-1][arg.arg] = collection_model
+        if "validate_call" in get_decorator_names(node.decorator_list):
+            self.validate_call_functions.append(node)
+
+    def leave_function(self) -> None:
+        self.function_stack.pop()
+        self.loop_depths.pop()
+        self.model_variables.pop()
+        self.model_collections.pop()
+
+    def enter_loop(self) -> None:
+        self.loop_depths[-1] += 1
+
+    def leave_loop(self) -> None:
+        self.loop_depths[-1] -= 1
+
+    @property
+    def in_loop(self) -> bool:
+        return self.loop_depths[-1] > 0
+
+    def get_annotated_model(self, annotation: ast.expr | None) -> str | None:
+        """Get the name of the model defined in the module an annotation refers to an instance of, if any.
+
+        Only the model and its optional variants are considered, not types using it (e.g. `dict[str, Model]`).
+        """
+        if isinstance(annotation, ast.BinOp) and isinstance(annotation.op, ast.BitOr):
+            # Model | None
+            if is_none(annotation.left):
+                return self.get_annotated_model(annotation.right)
+            return self.get_annotated_model(annotation.left) if is_none(annotation.right) else None
+        if isinstance(annotation, ast.Subscript) and is_name(annotation.value, "Optional"):
+            # Optional[Model]
+            return self.get_annotated_model(annotation.slice)
+
+        name: str | None = None
+        if isinstance(annotation, ast.Name):
+            name = annotation.id
+        elif isinstance(annotation, ast.Constant) and isinstance(annotation.value, str):
+            # "Model"
+            name = annotation.value
+        return name if name in self.model_configs else None
+
+    def get_annotated_collection_model(self, annotation: ast.expr | None) -> str | None:
+        """Get the name of the model defined in the module an annotation refers to a collection of, if any."""
+        if (
+            not isinstance(annotation, ast.Subscript)
+            or not isinstance(annotation.value, (ast.Name, ast.Attribute))
+            or not any(is_name(annotation.value, name) for name in ITERABLE_COLLECTIONS)
+        ):
+            return None
+        element = annotation.slice
+        if isinstance(element, ast.Tuple) and element.elts[1:] and is_ellipsis(element.elts[-1]):
+            # tuple[Model, ...]
+            element = element.elts[0]
+        return self.get_annotated_model(element)
+
+    def get_instantiated_model(self, node: ast.expr) -> str | None:
+        """Get the name of the model defined in the module an expression creates an instance of, if any."""
+        if not isinstance(node, ast.Call):
+            return None
+        if isinstance(node.func, ast.Name) and node.func.id in self.model_configs:
+            # Model(...)
+            return node.func.id
+        if (
+            isinstance(node.func, ast.Attribute)
+            and node.func.attr in MODEL_CONSTRUCTORS
+            and isinstance(node.func.value, ast.Name)
+            and node.func.value.id in self.model_configs
+        ):
+            # Model.model_validate(...)
+            return node.func.value.id
+        return None
+
+    def record_model_variable(
+        self, target: ast.expr, model_name: str | None, *, collection_model: str | None = None
+    ) -> None:
+        if self.class_stack and not self.in_function:
+            # Class attributes aren't variables of the current scope:
+            return
+        if isinstance(target, (ast.Tuple, ast.List)):
+            # m, n = ...: unpacked values aren't tracked
+            for elt in target.elts:
+                self.record_model_variable(elt, None)
+            return
+        if isinstance(target, ast.Starred):
+            self.record_model_variable(target.value, None)
+            return
+        if not isinstance(target, ast.Name):
+            return
+        if model_name is not None:
+            self.model_variables[-1][target.id] = model_name
+        else:
+            # The variable is reassigned to something else:
+            self.model_variables[-1].pop(target.id, None)
+        if collection_model is not None:
+            self.model_collections[-1][target.id] = collection_model
+        else:
+            self.model_collections[-1].pop(target.id, None)
+
+    def is_model_instance(self, node: ast.expr) -> bool:
+        return (isinstance(node, ast.Name) and node.id in self.model_variables[-1]) or (
+            self.get_instantiated_model(node) is not None
+        )
+
+    @property
+    def in_function(self) -> bool:
+        return bool(self.function_stack)
+
+    @property
+    def in_cached_function(self) -> bool:
+        # Only the innermost function matters: a closure returned by a cached function still runs on every call.
+        return bool(self.function_stack) and bool(
+            CACHE_DECORATORS & get_decorator_names(self.function_stack[-1].decorator_list)
+        )
+
+    @analysis_phase
     def _check_pyd_001(self, node: ast.AnnAssign) -> None:
         if (
             self.current_class in {"pydantic_model", "dataclass"}
@@ -42,19 +360,20 @@ class Visitor(ast.NodeVisitor):
         ):
             self.errors.append(PYD001.from_node(node))
 
+    @analysis_phase
     def _check_pyd_002(self, node: ast.ClassDef) -> None:
         if self.current_class == "pydantic_model":
-            invalid_assignments = [
-                assign
-                for assign in node.body
-                if isinstance(assign, ast.Assign)
-                if isinstance(assign.targets[0], ast.Name)
-                if not assign.targets[0].id.startswith("_")
-                if not assign.targets[0].id == "model_config"
-            ]
-            for assignment in invalid_assignments:
-                self.errors.append(PYD002.from_node(assignment))
+            for stmt in node.body:
+                self.check_deadline()
+                if (
+                    isinstance(stmt, ast.Assign)
+                    and isinstance(stmt.targets[0], ast.Name)
+                    and not stmt.targets[0].id.startswith("_")
+                    and stmt.targets[0].id != "model_config"
+                ):
+                    self.errors.append(PYD002.from_node(stmt))
 
+    @analysis_phase
     def _check_pyd_003(self, node: ast.AnnAssign) -> None:
         if (
             self.current_class in {"pydantic_model", "dataclass"}
@@ -65,6 +384,7 @@ class Visitor(ast.NodeVisitor):
         ):
             self.errors.append(PYD003.from_node(node))
 
+    @analysis_phase
     def _check_pyd_004(self, node: ast.AnnAssign) -> None:
         if (
             self.current_class in {"pydantic_model", "dataclass"}
@@ -85,11 +405,13 @@ class Visitor(ast.NodeVisitor):
             if field_call is not None:
                 self.errors.append(PYD004.from_node(node))
 
+    @analysis_phase
     def _check_pyd_005(self, node: ast.ClassDef) -> None:
         if self.current_class in {"pydantic_model", "dataclass"}:
             previous_targets: set[str] = set()
 
             for stmt in node.body:
+                self.check_deadline()
                 if isinstance(stmt, ast.AnnAssign) and isinstance(stmt.target, ast.Name):
                     # TODO only add before if AnnAssign?
                     # the following seems to work:
@@ -98,20 +420,24 @@ class Visitor(ast.NodeVisitor):
                     if previous_targets & extract_annotations(stmt.annotation):
                         self.errors.append(PYD005.from_node(stmt))
 
+    @analysis_phase
     def _check_pyd_006(self, node: ast.ClassDef) -> None:
         if self.current_class in {"pydantic_model", "dataclass"}:
             previous_targets: set[str] = set()
 
             for stmt in node.body:
+                self.check_deadline()
                 if isinstance(stmt, ast.AnnAssign) and isinstance(stmt.target, ast.Name):
                     if stmt.target.id in previous_targets:
                         self.errors.append(PYD006.from_node(stmt))
 
                     previous_targets.add(stmt.target.id)
 
+    @analysis_phase
     def _check_pyd_010(self, node: ast.ClassDef) -> None:
         if self.current_class == "other_class":
             for stmt in node.body:
+                self.check_deadline()
                 if (
                     isinstance(stmt, ast.AnnAssign)
                     and isinstance(stmt.target, ast.Name)
@@ -125,12 +451,258 @@ class Visitor(ast.NodeVisitor):
                     # __pydantic_config__ = ...
                     self.errors.append(PYD010.from_node(stmt))
 
+    @analysis_phase
+    def _check_pyd_100_class(self, node: ast.ClassDef) -> None:
+        if self.current_class == "pydantic_model" and self.in_function and not self.in_cached_function:
+            self.errors.append(PYD100.from_node(node))
+
+    @analysis_phase
+    def _check_pyd_100_call(self, node: ast.Call) -> None:
+        if is_function(node, "create_model") and self.in_function and not self.in_cached_function:
+            self.errors.append(PYD100.from_node(node))
+
+    @analysis_phase
+    def _check_pyd_101(self, node: ast.ClassDef) -> None:
+        if self.current_class != "pydantic_model":
+            return
+
+        for stmt in node.body:
+            self.check_deadline()
+            if not isinstance(stmt, ast.FunctionDef) or not _is_after_field_validator(stmt):
+                continue
+
+            all_params = [*stmt.args.posonlyargs, *stmt.args.args, *stmt.args.kwonlyargs]
+            params = [arg.arg for arg in all_params if arg.arg not in {"cls", "self"}]
+            if not params:
+                continue
+            value_name = params[0]
+            # Parameters (e.g. `info`) and local variables can't be used as constraint bounds:
+            dynamic_names = {arg.arg for arg in all_params} | get_assigned_names(stmt.body)
+
+            for body_stmt in stmt.body:
+                if value_name in get_assigned_names([body_stmt]):
+                    # v = v.strip(): following checks don't apply to the validated value anymore.
+                    break
+
+                constraints: list[str] | None = None
+                if (
+                    isinstance(body_stmt, ast.If)
+                    and not body_stmt.orelse
+                    and all(isinstance(s, ast.Raise) for s in body_stmt.body)
+                ):
+                    # if v < 0: raise ValueError(...)
+                    constraints = get_native_constraints(
+                        body_stmt.test, value_name, failing=True, dynamic_names=dynamic_names
+                    )
+                elif isinstance(body_stmt, ast.Assert):
+                    # assert v >= 0
+                    constraints = get_native_constraints(
+                        body_stmt.test, value_name, failing=False, dynamic_names=dynamic_names
+                    )
+
+                if constraints:
+                    keywords = ", ".join(f"{c}=..." for c in dict.fromkeys(constraints))
+                    self.errors.append(PYD101.from_node(body_stmt, field_call=f"Field({keywords})"))
+
+    @analysis_phase
+    def _check_pyd_102(self, node: ast.AnnAssign) -> None:
+        if self.current_class != "pydantic_model" or node.value is None:
+            return
+
+        default: ast.expr | None = node.value
+        if isinstance(node.value, ast.Call) and is_function(node.value, "Field"):
+            # f: list[int] = Field(default=[...])
+            default = next((kw.value for kw in node.value.keywords if kw.arg == "default"), None)
+
+        if default is not None and is_expensive_mutable_literal(default, max_size=MUTABLE_DEFAULT_MAX_SIZE):
+            self.errors.append(PYD102.from_node(node))
+
+    @analysis_phase
+    def _check_pyd_103(self, node: ast.AnnAssign) -> None:
+        if (
+            self.current_class in {"pydantic_model", "dataclass"}
+            and isinstance(node.value, ast.Call)
+            and (is_function(node.value, "Field") or is_function(node.value, "field"))
+        ):
+            default_factory = next((kw.value for kw in node.value.keywords if kw.arg == "default_factory"), None)
+            factory = get_lambda_factory(default_factory) if default_factory is not None else None
+            if factory is not None:
+                self.errors.append(PYD103.from_node(node, factory=factory))
+
+    @analysis_phase
+    def _check_pyd_104(self, node: ast.Call) -> None:
+        if is_function(node, "model_rebuild") and not self.in_function:
+            self.errors.append(PYD104.from_node(node))
+
+    @analysis_phase
+    def _check_pyd_105(self, node: ast.ClassDef) -> None:
+        if self.current_class != "pydantic_model" or self.module_classes.get(node.name) is not node:
+            return
+
+        for stmt in node.body:
+            self.check_deadline()
+            if isinstance(stmt, ast.AnnAssign) and any(
+                name in self.module_classes
+                and self.module_classes[name].lineno > node.lineno
+                # Mutually recursive models can't be reordered, and require a rebuild anyway:
+                and not self.references_class(name, node.name)
+                for name in extract_annotations(stmt.annotation)
+            ):
+                self.errors.append(PYD105.from_node(stmt))
+
+    def get_class_references(self, name: str) -> set[str]:
+        if name not in self.module_class_references:
+            node = self.module_classes[name]
+            references = {base.id for base in node.bases if isinstance(base, ast.Name)}
+            for stmt in node.body:
+                self.check_deadline()
+                if isinstance(stmt, ast.AnnAssign):
+                    references |= extract_annotations(stmt.annotation)
+            self.module_class_references[name] = references & self.module_classes.keys()
+        return self.module_class_references[name]
+
+    def references_class(self, name: str, target: str) -> bool:
+        """Whether a module class references another one, directly or through other module classes."""
+        seen: set[str] = set()
+        to_visit = [name]
+        while to_visit:
+            current = to_visit.pop()
+            if current == target:
+                return True
+            if current not in seen:
+                seen.add(current)
+                to_visit.extend(self.get_class_references(current))
+        return False
+
+    @analysis_phase
+    def _check_pyd_106(self) -> None:
+        if len(self.module_models) <= self.options.max_models_without_defer_build:
+            return
+
+        for model in self.module_models:
+            if not is_true(self.model_configs.get(model.name, {}).get("defer_build")):
+                self.errors.append(PYD106.from_node(model, max_models=self.options.max_models_without_defer_build))
+
+    @analysis_phase
+    def _check_pyd_107(self, node: ast.ClassDef) -> None:
+        if self.current_class != "pydantic_model":
+            return
+
+        cost = estimate_model_cost(
+            node,
+            model_names=self.model_configs,
+            config=self.model_configs[node.name],
+            bases=[
+                self.model_costs_by_name[base.id]
+                for base in node.bases
+                if isinstance(base, ast.Name) and base.id in self.model_costs_by_name
+            ],
+            checkpoint=self.check_deadline,
+        )
+        self.model_costs.append(cost)
+        self.model_costs_by_name[node.name] = cost
+        if cost.score > self.options.max_model_cost:
+            self.errors.append(PYD107.from_node(node, score=cost.score, max_cost=self.options.max_model_cost))
+
+    def _record_call_site(self, node: ast.Call) -> None:
+        if self.in_loop:
+            if isinstance(node.func, ast.Name):
+                self.loop_call_names.add(node.func.id)
+            elif (
+                isinstance(node.func, ast.Attribute)
+                and isinstance(node.func.value, ast.Name)
+                and node.func.value.id in {"self", "cls"}
+            ):
+                # self.helper(...), calls on other objects (e.g. `logger.info(...)`) being unrelated to the module
+                self.loop_call_names.add(node.func.attr)
+
+    @analysis_phase
+    def _check_pyd_109(self) -> None:
+        for func in self.validate_call_functions:
+            if func.name.startswith("_") and not func.name.endswith("__"):
+                self.errors.append(PYD109.from_node(func, reason="a private function"))
+            elif func.name in self.loop_call_names:
+                self.errors.append(PYD109.from_node(func, reason="a function called in a loop"))
+
+    @analysis_phase
+    def _check_pyd_110(self, node: ast.Call) -> None:
+        if not self.in_loop:
+            return
+
+        if (
+            is_function(node, "model_copy")
+            and isinstance(node.func, ast.Attribute)
+            and any(kw.arg == "deep" and is_true(kw.value) for kw in node.keywords)
+        ):
+            # model.model_copy(deep=True)
+            self.errors.append(PYD110.from_node(node))
+        elif is_function(node, "deepcopy") and len(node.args) == 1 and self.is_model_instance(node.args[0]):
+            # copy.deepcopy(model)
+            self.errors.append(PYD110.from_node(node))
+
+    @analysis_phase
+    def _check_pyd_111(self, node: ast.ClassDef) -> None:
+        if self.current_class != "pydantic_model":
+            return
+
+        frozen = is_true(self.model_configs[node.name].get("frozen"))
+        for stmt in node.body:
+            self.check_deadline()
+            if not isinstance(stmt, ast.FunctionDef):
+                continue
+            decorator_names = get_decorator_names(stmt.decorator_list)
+            cached = "cached_property" in decorator_names
+            if "computed_field" not in decorator_names or (cached and frozen):
+                continue
+            if get_body_complexity(stmt) > self.options.max_computed_field_complexity:
+                reason = (
+                    "cached on a model that isn't frozen, the cached value can become stale"
+                    if cached
+                    else "recomputed on every access and serialization"
+                )
+                self.errors.append(PYD111.from_node(stmt, reason=reason))
+
+    @analysis_phase
+    def _check_pyd_112(self, node: ast.ClassDef) -> None:
+        if self.current_class != "dataclass" or self.options.min_python_version < DATACLASS_SLOTS_MIN_PYTHON_VERSION:
+            return
+
+        if not has_slots(node):
+            self.errors.append(PYD112.from_node(node))
+
+    @analysis_phase
+    def _check_pyd_113(self, node: ast.Assign | ast.AugAssign | ast.AnnAssign) -> None:
+        if not self.in_loop:
+            return
+
+        targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+        for target in targets:
+            if isinstance(target, ast.Attribute) and isinstance(target.value, ast.Name):
+                model_name = self.model_variables[-1].get(target.value.id)
+                if model_name is not None and is_true(self.model_configs[model_name].get("validate_assignment")):
+                    # model.field = ...
+                    self.errors.append(PYD113.from_node(node))
+
+    def visit_Module(self, node: ast.Module) -> None:
+        if self.options.max_analysis_time:
+            self.deadline = time.monotonic() + self.options.max_analysis_time
+        self.module_classes = {stmt.name: stmt for stmt in node.body if isinstance(stmt, ast.ClassDef)}
+        self.generic_visit(node)
+        self._check_pyd_106()
+        self._check_pyd_109()
+
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
         self.enter_class(node)
+        self._check_pyd_100_class(node)
         self._check_pyd_002(node)
         self._check_pyd_005(node)
         self._check_pyd_006(node)
         self._check_pyd_010(node)
+        self._check_pyd_101(node)
+        self._check_pyd_105(node)
+        self._check_pyd_107(node)
+        self._check_pyd_111(node)
+        self._check_pyd_112(node)
         self.generic_visit(node)
         self.leave_class()
 
@@ -138,4 +710,103 @@ class Visitor(ast.NodeVisitor):
         self._check_pyd_001(node)
         self._check_pyd_003(node)
         self._check_pyd_004(node)
+        self._check_pyd_102(node)
+        self._check_pyd_103(node)
+        self._check_pyd_113(node)
+        self.generic_visit(node)
+        # x: Model = ...
+        model_name = self.get_annotated_model(node.annotation)
+        if model_name is None and node.value is not None:
+            model_name = self.get_instantiated_model(node.value)
+        # x: list[Model] = ...
+        self.record_model_variable(
+            node.target, model_name, collection_model=self.get_annotated_collection_model(node.annotation)
+        )
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        self._check_pyd_113(node)
+        self.generic_visit(node)
+        for target in node.targets:
+            self.record_model_variable(target, self.get_instantiated_model(node.value))
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self.enter_function(node)
         self.generic_visit(node)
+        self.leave_function()
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        self.enter_function(node)
+        self.generic_visit(node)
+        self.leave_function()
+
+    def visit_Call(self, node: ast.Call) -> None:
+        self._check_pyd_100_call(node)
+        self._check_pyd_104(node)
+        self._record_call_site(node)
+        self._check_pyd_110(node)
+        self.generic_visit(node)
+
+    def visit_AugAssign(self, node: ast.AugAssign) -> None:
+        self._check_pyd_113(node)
+        self.generic_visit(node)
+
+    def visit_For(self, node: ast.For | ast.AsyncFor) -> None:
+        # The target and iterable are only evaluated once:
+        self.visit(node.target)
+        self.visit(node.iter)
+        # def func(models: list[Model]):
+        #     for model in models: ...
+        iter_model = self.model_collections[-1].get(node.iter.id) if isinstance(node.iter, ast.Name) else None
+        self.record_model_variable(node.target, iter_model)
+        self.enter_loop()
+        for stmt in node.body:
+            self.visit(stmt)
+        self.leave_loop()
+        for stmt in node.orelse:
+            self.visit(stmt)
+
+    visit_AsyncFor = visit_For
+
+    def visit_With(self, node: ast.With | ast.AsyncWith) -> None:
+        for item in node.items:
+            self.visit(item)
+            if item.optional_vars is not None:
+                # with ... as m:
+                self.record_model_variable(item.optional_vars, None)
+        for stmt in node.body:
+            self.visit(stmt)
+
+    visit_AsyncWith = visit_With
+
+    def visit_NamedExpr(self, node: ast.NamedExpr) -> None:
+        self.generic_visit(node)
+        # (m := ...)
+        self.record_model_variable(node.target, self.get_instantiated_model(node.value))
+
+    def visit_While(self, node: ast.While) -> None:
+        self.enter_loop()
+        self.visit(node.test)
+        for stmt in node.body:
+            self.visit(stmt)
+        self.leave_loop()
+        for stmt in node.orelse:
+            self.visit(stmt)
+
+    def _visit_comprehension(self, node: ast.ListComp | ast.SetComp | ast.DictComp | ast.GeneratorExp) -> None:
+        # The first iterable is only evaluated once, as in `for` loops:
+        first_generator, *generators = node.generators
+        self.visit(first_generator.iter)
+        self.enter_loop()
+        self.visit(first_generator.target)
+        for if_ in first_generator.ifs:
+            self.visit(if_)
+        for generator in generators:
+            self.visit(generator)
+        if isinstance(node, ast.DictComp):
+            self.visit(node.key)
+            self.visit(node.value)
+        else:
+            self.visit(node.elt)
+        self.leave_loop()
+
+    visit_ListComp = visit_SetComp = visit_DictComp = visit_GeneratorExp = _visit_comprehension
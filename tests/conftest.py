@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import argparse
+from collections.abc import Iterator
+from dataclasses import asdict, replace
+from typing import Any, Callable
+
+import pytest
+from flake8.options.manager import OptionManager  # type: ignore[import-untyped]
+
+from flake8_pydantic.baseline import load_baseline
+from flake8_pydantic.options import Options
+from flake8_pydantic.plugin import Plugin
+
+ParseOptions = Callable[..., None]
+
+
+@pytest.fixture(autouse=True)
+def restore_options() -> Iterator[None]:
+    options = Plugin.options
+    yield
+    Plugin.options = options
+    load_baseline.cache_clear()
+
+
+@pytest.fixture
+def option_manager() -> OptionManager:
+    """An option manager with the plugin options registered, as flake8 would create it."""
+    option_manager = OptionManager(version="", plugin_versions="", parents=[], formatter_names=[])
+    Plugin.add_options(option_manager)
+    return option_manager
+
+
+@pytest.fixture
+def parse_options(option_manager: OptionManager) -> ParseOptions:
+    """Parse the plugin options, as flake8 would do from the command line and configuration."""
+
+    def _parse_options(**kwargs: Any) -> None:
+        options = replace(Options(), **kwargs)
+        Plugin.parse_options(
+            option_manager,
+            argparse.Namespace(**{f"pyd_{k}": v for k, v in asdict(options).items()}),
+            [],
+        )
+
+    return _parse_options
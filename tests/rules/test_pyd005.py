@@ -38,14 +38,37 @@ class Model(BaseModel):
     date: int | date | None = None
 """
 
+PYD005_7 = """
+class Model(BaseModel):
+    date: "date"
+"""
+
+PYD005_8 = """
+class Model(BaseModel):
+    date: list[list[date]]
+"""
+
 # OK:
 
-PYD005_7 = """
+PYD005_9 = """
 class Model(BaseModel):
     foo: date | None = None
     date: int
 """
 
+PYD005_10 = """
+class Model(BaseModel):
+    a: int
+    b: Literal["a", "b"]
+"""
+
+PYD005_11 = """
+class Model(BaseModel):
+    a: Annotated[()]
+    b: "\\x00"
+    c: "not valid"
+"""
+
 
 @pytest.mark.parametrize(
     ["source", "expected"],
@@ -56,7 +79,11 @@ class Model(BaseModel):
         (PYD005_4, [PYD005(4, 4)]),
         (PYD005_5, [PYD005(3, 4)]),
         (PYD005_6, [PYD005(3, 4)]),
-        (PYD005_7, []),
+        (PYD005_7, [PYD005(3, 4)]),
+        (PYD005_8, [PYD005(3, 4)]),
+        (PYD005_9, []),
+        (PYD005_10, []),
+        (PYD005_11, []),
     ],
 )
 def test_pyd005(source: str, expected: list[Error]) -> None:
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import ast
+
+import pytest
+
+from flake8_pydantic.errors import PYD100, Error
+from flake8_pydantic.visitor import Visitor
+
+PYD100_CLASS = """
+def func():
+    class Model(BaseModel):
+        a: int
+"""
+
+PYD100_METHOD = """
+class Service:
+    async def handle(self):
+        class Model(BaseModel):
+            a: int
+"""
+
+PYD100_CREATE_MODEL = """
+def func():
+    return create_model("Model", a=(int, ...))
+"""
+
+PYD100_CREATE_MODEL_ATTRIBUTE = """
+def func():
+    return pydantic.create_model("Model", a=(int, ...))
+"""
+
+PYD100_CACHED = """
+@functools.lru_cache(maxsize=None)
+def func():
+    class Model(BaseModel):
+        a: int
+
+    return create_model("Model", a=(int, ...))
+"""
+
+PYD100_CACHED_OUTER = """
+@cache
+def func():
+    def inner():
+        return create_model("Model", a=(int, ...))
+"""
+
+PYD100_MODULE_LEVEL = """
+Model = create_model("Model", a=(int, ...))
+
+class Model(BaseModel):
+    a: int
+"""
+
+PYD100_OTHER_CLASS = """
+def func():
+    class Other:
+        a: int
+"""
+
+
+@pytest.mark.parametrize(
+    ["source", "expected"],
+    [
+        (PYD100_CLASS, [PYD100(3, 4)]),
+        (PYD100_METHOD, [PYD100(4, 8)]),
+        (PYD100_CREATE_MODEL, [PYD100(3, 11)]),
+        (PYD100_CREATE_MODEL_ATTRIBUTE, [PYD100(3, 11)]),
+        (PYD100_CACHED, []),
+        (PYD100_CACHED_OUTER, [PYD100(5, 15)]),
+        (PYD100_MODULE_LEVEL, []),
+        (PYD100_OTHER_CLASS, []),
+    ],
+)
+def test_pyd100(source: str, expected: list[Error]) -> None:
+    module = ast.parse(source)
+    visitor = Visitor()
+    visitor.visit(module)
+
+    assert visitor.errors == expected
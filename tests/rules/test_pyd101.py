@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import ast
+
+import pytest
+
+from flake8_pydantic._utils import LENGTH_CONSTRAINTS, PYDANTIC_FIELD_ARGUMENTS, VALUE_CONSTRAINTS
+from flake8_pydantic.errors import PYD101, Error
+from flake8_pydantic.visitor import Visitor
+
+PYD101_COMPARISON = """
+class Model(BaseModel):
+    a: int
+
+    @field_validator("a")
+    @classmethod
+    def validate_a(cls, v):
+        if v < 0:
+            raise ValueError("Must be positive")
+        return v
+"""
+
+PYD101_COMPARISON_FLIPPED = """
+class Model(BaseModel):
+    a: int
+
+    @field_validator("a")
+    def validate_a(cls, v):
+        if 10 <= v:
+            raise ValueError
+        return v
+"""
+
+PYD101_LENGTH = """
+class Model(BaseModel):
+    a: str
+
+    @field_validator("a")
+    def validate_a(cls, v):
+        if len(v) > MAX_LENGTH or len(v) < 1:
+            raise ValueError
+        return v
+"""
+
+PYD101_ASSERT = """
+class Model(BaseModel):
+    a: int
+
+    @pydantic.field_validator("a", mode="after")
+    def validate_a(cls, value):
+        assert 0 < value <= 10
+        return value
+"""
+
+PYD101_REGEX = """
+class Model(BaseModel):
+    a: str
+
+    @field_validator("a")
+    def validate_a(cls, v):
+        if not re.fullmatch(r"[a-z]+", v):
+            raise ValueError
+        return v
+"""
+
+PYD101_BEFORE = """
+class Model(BaseModel):
+    a: int
+
+    @field_validator("a", mode="before")
+    def validate_a(cls, v):
+        if v < 0:
+            raise ValueError
+        return v
+"""
+
+PYD101_CROSS_FIELD = """
+class Model(BaseModel):
+    a: int
+
+    @field_validator("a")
+    def validate_a(cls, v, info):
+        if v < info.data["b"]:
+            raise ValueError
+        return v
+"""
+
+PYD101_PARAMETER_ATTRIBUTE = """
+class Model(BaseModel):
+    a: int
+
+    @field_validator("a")
+    def validate_a(cls, v, info):
+        if v > info.context.limit:
+            raise ValueError
+        return v
+"""
+
+PYD101_LOCAL_VARIABLE = """
+class Model(BaseModel):
+    a: int
+
+    @field_validator("a")
+    def validate_a(cls, v):
+        limit = get_limit()
+        if v > limit:
+            raise ValueError
+        return v
+"""
+
+PYD101_VALUE_REASSIGNED = """
+class Model(BaseModel):
+    a: str
+
+    @field_validator("a")
+    def validate_a(cls, v):
+        if len(v) < 1:
+            raise ValueError
+        v = v.strip()
+        if len(v) > 50:
+            raise ValueError
+        return v
+"""
+
+PYD101_OTHER_LOGIC = """
+class Model(BaseModel):
+    a: int
+
+    @field_validator("a")
+    def validate_a(cls, v):
+        if v < 0:
+            log("negative")
+        if v == 0 or v > 10:
+            raise ValueError
+        return v
+"""
+
+PYD101_MODEL_VALIDATOR = """
+class Model(BaseModel):
+    a: int
+
+    @model_validator(mode="after")
+    def validate_a(self):
+        if self.a < 0:
+            raise ValueError
+        return self
+"""
+
+
+@pytest.mark.parametrize(
+    ["source", "expected"],
+    [
+        (PYD101_COMPARISON, [PYD101(8, 8, "Field(ge=...)")]),
+        (PYD101_COMPARISON_FLIPPED, [PYD101(7, 8, "Field(lt=...)")]),
+        (PYD101_LENGTH, [PYD101(7, 8, "Field(max_length=..., min_length=...)")]),
+        (PYD101_ASSERT, [PYD101(7, 8, "Field(gt=..., le=...)")]),
+        (PYD101_REGEX, [PYD101(7, 8, "Field(pattern=...)")]),
+        (PYD101_BEFORE, []),
+        (PYD101_CROSS_FIELD, []),
+        (PYD101_PARAMETER_ATTRIBUTE, []),
+        (PYD101_LOCAL_VARIABLE, []),
+        (PYD101_VALUE_REASSIGNED, [PYD101(7, 8, "Field(min_length=...)")]),
+        (PYD101_OTHER_LOGIC, []),
+        (PYD101_MODEL_VALIDATOR, []),
+    ],
+)
+def test_pyd101(source: str, expected: list[Error]) -> None:
+    module = ast.parse(source)
+    visitor = Visitor()
+    visitor.visit(module)
+
+    assert visitor.errors == expected
+
+
+def test_pyd101_constraints_are_field_arguments() -> None:
+    assert {*VALUE_CONSTRAINTS.values(), *LENGTH_CONSTRAINTS.values(), "pattern"} <= PYDANTIC_FIELD_ARGUMENTS
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import ast
+
+import pytest
+
+from flake8_pydantic.errors import PYD102, Error
+from flake8_pydantic.visitor import Visitor
+
+PYD102_NESTED = """
+class Model(BaseModel):
+    a: list[list[int]] = [[1, 2], [3, 4]]
+"""
+
+PYD102_LARGE = """
+class Model(BaseModel):
+    a: set[int] = {1, 2, 3, 4, 5, 6, 7, 8, 9}
+"""
+
+PYD102_NESTED_DICT = """
+class Model(BaseModel):
+    a: dict[str, tuple[int, ...]] = {"a": (1, 2)}
+"""
+
+PYD102_FIELD = """
+class Model(BaseModel):
+    a: list[dict[str, int]] = Field(default=[{"a": 1}], description="")
+"""
+
+PYD102_OK = """
+class Model(BaseModel):
+    a: list[int] = []
+    b: dict[str, int] = {"a": 1, "b": 2}
+    c: tuple[tuple[int, ...], ...] = ((1, 2), (3, 4))
+    d: list[int] = Field(default_factory=lambda: [[1, 2], [3, 4]])
+"""
+
+PYD102_DATACLASS = """
+@dataclass
+class Model:
+    a: list[list[int]] = field(default_factory=lambda: [[1, 2], [3, 4]])
+"""
+
+
+@pytest.mark.parametrize(
+    ["source", "expected"],
+    [
+        (PYD102_NESTED, [PYD102(3, 4)]),
+        (PYD102_LARGE, [PYD102(3, 4)]),
+        (PYD102_NESTED_DICT, [PYD102(3, 4)]),
+        (PYD102_FIELD, [PYD102(3, 4)]),
+        (PYD102_OK, []),
+        (PYD102_DATACLASS, []),
+    ],
+)
+def test_pyd102(source: str, expected: list[Error]) -> None:
+    module = ast.parse(source)
+    visitor = Visitor()
+    visitor.visit(module)
+
+    assert visitor.errors == expected
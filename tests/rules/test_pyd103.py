@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import ast
+
+import pytest
+
+from flake8_pydantic.errors import PYD103, Error
+from flake8_pydantic.visitor import Visitor
+
+PYD103_LIST = """
+class Model(BaseModel):
+    a: list[int] = Field(default_factory=lambda: [])
+"""
+
+PYD103_DICT = """
+class Model(BaseModel):
+    a: dict[str, int] = Field(default_factory=lambda: {})
+"""
+
+PYD103_SET_CALL = """
+class Model(BaseModel):
+    a: set[int] = Field(default_factory=lambda: set(), description="")
+"""
+
+PYD103_DATACLASS = """
+@dataclass
+class Model:
+    a: list[int] = dataclasses.field(default_factory=lambda: [])
+"""
+
+PYD103_OK = """
+class Model(BaseModel):
+    a: list[int] = Field(default_factory=list)
+    b: list[int] = Field(default_factory=lambda: [1])
+    c: dict[str, int] = Field(default_factory=lambda data: {})
+"""
+
+
+@pytest.mark.parametrize(
+    ["source", "expected"],
+    [
+        (PYD103_LIST, [PYD103(3, 4, "list")]),
+        (PYD103_DICT, [PYD103(3, 4, "dict")]),
+        (PYD103_SET_CALL, [PYD103(3, 4, "set")]),
+        (PYD103_DATACLASS, [PYD103(4, 4, "list")]),
+        (PYD103_OK, []),
+    ],
+)
+def test_pyd103(source: str, expected: list[Error]) -> None:
+    module = ast.parse(source)
+    visitor = Visitor()
+    visitor.visit(module)
+
+    assert visitor.errors == expected
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import ast
+
+import pytest
+
+from flake8_pydantic.errors import PYD104, Error
+from flake8_pydantic.visitor import Visitor
+
+PYD104_MODULE_LEVEL = """
+class Model(BaseModel):
+    a: "Other"
+
+class Other(BaseModel):
+    pass
+
+Model.model_rebuild()
+"""
+
+PYD104_FUNCTION = """
+def rebuild_models():
+    Model.model_rebuild()
+"""
+
+
+@pytest.mark.parametrize(
+    ["source", "expected"],
+    [
+        (PYD104_MODULE_LEVEL, [PYD104(8, 0)]),
+        (PYD104_FUNCTION, []),
+    ],
+)
+def test_pyd104(source: str, expected: list[Error]) -> None:
+    module = ast.parse(source)
+    visitor = Visitor()
+    visitor.visit(module)
+
+    assert [error for error in visitor.errors if error.error_code == "PYD104"] == expected
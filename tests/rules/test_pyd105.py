@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import ast
+
+import pytest
+
+from flake8_pydantic.errors import PYD105, Error
+from flake8_pydantic.visitor import Visitor
+
+PYD105_STRING = """
+class Model(BaseModel):
+    a: "Other"
+    b: int
+
+class Other(BaseModel):
+    pass
+"""
+
+PYD105_NESTED = """
+class Model(BaseModel):
+    a: dict[str, list[Other | None]]
+
+class Other(BaseModel):
+    pass
+"""
+
+PYD105_NESTED_STRING = """
+class Model(BaseModel):
+    a: list["Other"]
+
+class Other(BaseModel):
+    pass
+"""
+
+PYD105_SELF_REFERENCE = """
+class Model(BaseModel):
+    children: list["Model"]
+"""
+
+PYD105_MUTUALLY_RECURSIVE = """
+class Parent(BaseModel):
+    children: list["Child"]
+    other: "Other"
+
+class Child(BaseModel):
+    items: list["Item"]
+
+class Item(BaseModel):
+    parent: Parent
+
+class Other(BaseModel):
+    pass
+"""
+
+PYD105_DEFINED_BEFORE = """
+class Other(BaseModel):
+    pass
+
+class Model(BaseModel):
+    a: "Other"
+"""
+
+PYD105_ANNOTATED_METADATA = """
+class Model(BaseModel):
+    a: Annotated[int, "Other"]
+
+class Other(BaseModel):
+    pass
+"""
+
+PYD105_LITERAL = """
+class Model(BaseModel):
+    kind: Literal["Other"]
+
+class Other(BaseModel):
+    pass
+"""
+
+
+@pytest.mark.parametrize(
+    ["source", "expected"],
+    [
+        (PYD105_STRING, [PYD105(3, 4)]),
+        (PYD105_NESTED, [PYD105(3, 4)]),
+        (PYD105_NESTED_STRING, [PYD105(3, 4)]),
+        (PYD105_SELF_REFERENCE, []),
+        (PYD105_MUTUALLY_RECURSIVE, [PYD105(4, 4)]),
+        (PYD105_DEFINED_BEFORE, []),
+        (PYD105_ANNOTATED_METADATA, []),
+        (PYD105_LITERAL, []),
+    ],
+)
+def test_pyd105(source: str, expected: list[Error]) -> None:
+    module = ast.parse(source)
+    visitor = Visitor()
+    visitor.visit(module)
+
+    assert visitor.errors == expected
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import ast
+
+import pytest
+
+from flake8_pydantic.errors import PYD106, Error
+from flake8_pydantic.options import Options
+from flake8_pydantic.visitor import Visitor
+
+PYD106_NOT_DEFERRED = """
+class Model1(BaseModel):
+    pass
+
+class Model2(BaseModel):
+    pass
+
+class Model3(BaseModel):
+    pass
+"""
+
+PYD106_PARTIALLY_DEFERRED = """
+class Base(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+class Model1(Base):
+    pass
+
+class Model2(BaseModel, defer_build=True):
+    pass
+
+class Model3(BaseModel):
+    model_config = {"defer_build": True}
+
+class Model4(BaseModel):
+    model_config = ConfigDict(defer_build=False)
+"""
+
+PYD106_UNDER_THRESHOLD = """
+class Model1(BaseModel):
+    pass
+
+class Model2(BaseModel):
+    pass
+
+def func():
+    class Model3(BaseModel):
+        pass
+"""
+
+
+@pytest.mark.parametrize(
+    ["source", "expected"],
+    [
+        (PYD106_NOT_DEFERRED, [PYD106(2, 0, 2), PYD106(5, 0, 2), PYD106(8, 0, 2)]),
+        (PYD106_PARTIALLY_DEFERRED, [PYD106(14, 0, 2)]),
+        (PYD106_UNDER_THRESHOLD, []),
+    ],
+)
+def test_pyd106(source: str, expected: list[Error]) -> None:
+    module = ast.parse(source)
+    visitor = Visitor(Options(max_models_without_defer_build=2))
+    visitor.visit(module)
+
+    assert [error for error in visitor.errors if error.error_code == "PYD106"] == expected
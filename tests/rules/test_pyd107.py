@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import ast
+
+import pytest
+
+from flake8_pydantic.errors import PYD107, Error
+from flake8_pydantic.options import Options
+from flake8_pydantic.visitor import Visitor
+
+PYD107_EXPENSIVE = """
+class Nested(BaseModel):
+    a: int
+
+class Model(BaseModel):
+    model_config = ConfigDict(validate_assignment=True)
+
+    a: Nested
+    b: int | str | None
+
+    @field_validator("a")
+    def validate_a(cls, v):
+        return v
+
+    @computed_field
+    @property
+    def c(self) -> int:
+        return 1
+"""
+
+PYD107_INHERITED_CONFIG = """
+class Base(BaseModel, revalidate_instances="always"):
+    pass
+
+class Model(Base):
+    a: int
+"""
+
+PYD107_DISCRIMINATED = """
+class Model(BaseModel):
+    _private: int
+    x: ClassVar[int]
+    a: Annotated[Cat | Dog | Lizard, Field(discriminator="kind")]
+    b: Cat | Dog = Field(discriminator="kind")
+"""
+
+PYD107_INHERITED_FIELDS = (
+    """
+class Base(BaseModel):
+"""
+    + "".join(f"    f{i}: int\n" for i in range(11))
+    + """
+class Model(Base):
+    a: int
+"""
+)
+
+
+@pytest.mark.parametrize(
+    ["source", "expected"],
+    [
+        # 2 fields + 1 nested model + 2 union members + 1 validator + 1 computed field + 1 config flag
+        (PYD107_EXPENSIVE, [PYD107(5, 0, 2 + 3 + 4 + 5 + 3 + 10, 10)]),
+        (PYD107_INHERITED_CONFIG, [PYD107(5, 0, 1 + 10, 10)]),
+        (PYD107_DISCRIMINATED, []),
+        (PYD107_INHERITED_FIELDS, [PYD107(2, 0, 11, 10), PYD107(15, 0, 12, 10)]),
+    ],
+)
+def test_pyd107(source: str, expected: list[Error]) -> None:
+    module = ast.parse(source)
+    visitor = Visitor(Options(max_model_cost=10))
+    visitor.visit(module)
+
+    assert visitor.errors == expected
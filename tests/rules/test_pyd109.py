@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import ast
+
+import pytest
+
+from flake8_pydantic.errors import PYD109, Error
+from flake8_pydantic.visitor import Visitor
+
+PYD109_PRIVATE = """
+@validate_call
+def _helper(a: int) -> int:
+    return a
+"""
+
+PYD109_CALLED_IN_LOOP = """
+@pydantic.validate_call(validate_return=True)
+def helper(a: int) -> int:
+    return a
+
+def main(values):
+    for value in values:
+        helper(value)
+"""
+
+PYD109_CALLED_IN_COMPREHENSION = """
+class Service:
+    @validate_call
+    def helper(self, a: int) -> int:
+        return a
+
+    def main(self, values):
+        return [self.helper(value) for value in values]
+"""
+
+PYD109_CALLED_IN_WHILE_CONDITION = """
+@validate_call
+def helper(a: int) -> bool:
+    return True
+
+while helper(1):
+    pass
+"""
+
+PYD109_CALLED_IN_LOOP_ITERABLE = """
+@validate_call
+def helper(a: int) -> list[int]:
+    return [a]
+
+for value in helper(1):
+    def nested():
+        return helper(value)
+"""
+
+PYD109_CALLED_IN_COMPREHENSION_ITERABLE = """
+@validate_call
+def load(a: int) -> list[int]:
+    return [a]
+
+@validate_call
+def check(a: int) -> list[int]:
+    return [a]
+
+values = [value for value in load(1) for _ in check(value)]
+"""
+
+PYD109_CALLED_ON_OTHER_OBJECT_IN_LOOP = """
+@validate_call
+def info(message: str) -> None:
+    pass
+
+for value in values:
+    logger.info(value)
+"""
+
+PYD109_SUBSCRIPT_DECORATOR = """
+@handlers["name"]()
+def helper(a: int) -> int:
+    return a
+
+for value in values:
+    helper(value)
+"""
+
+PYD109_PUBLIC = """
+@validate_call
+def helper(a: int) -> int:
+    return a
+
+def __dunder__():
+    pass
+
+helper(1)
+"""
+
+
+@pytest.mark.parametrize(
+    ["source", "expected"],
+    [
+        (PYD109_PRIVATE, [PYD109(3, 0, "a private function")]),
+        (PYD109_CALLED_IN_LOOP, [PYD109(3, 0, "a function called in a loop")]),
+        (PYD109_CALLED_IN_COMPREHENSION, [PYD109(4, 4, "a function called in a loop")]),
+        (PYD109_CALLED_IN_WHILE_CONDITION, [PYD109(3, 0, "a function called in a loop")]),
+        (PYD109_CALLED_IN_LOOP_ITERABLE, []),
+        (PYD109_CALLED_IN_COMPREHENSION_ITERABLE, [PYD109(7, 0, "a function called in a loop")]),
+        (PYD109_CALLED_ON_OTHER_OBJECT_IN_LOOP, []),
+        (PYD109_SUBSCRIPT_DECORATOR, []),
+        (PYD109_PUBLIC, []),
+    ],
+)
+def test_pyd109(source: str, expected: list[Error]) -> None:
+    module = ast.parse(source)
+    visitor = Visitor()
+    visitor.visit(module)
+
+    assert visitor.errors == expected
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import ast
+
+import pytest
+
+from flake8_pydantic.errors import PYD110, Error
+from flake8_pydantic.visitor import Visitor
+
+PYD110_MODEL_COPY = """
+def func(items):
+    for item in items:
+        item.model_copy(deep=True)
+"""
+
+PYD110_DEEPCOPY_PARAMETER = """
+class Model(BaseModel):
+    a: int
+
+def func(model: Model | None, n: int):
+    return [copy.deepcopy(model) for _ in range(n)]
+"""
+
+PYD110_DEEPCOPY_INSTANCE = """
+class Model(BaseModel):
+    a: int
+
+def func(data, n):
+    model = Model.model_validate(data)
+    other: Model = get_model()
+    while n:
+        deepcopy(model)
+        deepcopy(other)
+        deepcopy(Model(a=1))
+"""
+
+PYD110_DEEPCOPY_OPTIONAL = """
+class Model(BaseModel):
+    a: int
+
+def func(first: Optional[Model], second: None | Model, third: "Model", n: int):
+    for _ in range(n):
+        deepcopy(first)
+        deepcopy(second)
+        deepcopy(third)
+"""
+
+PYD110_DEEPCOPY_NOT_INSTANCE = """
+class Model(BaseModel):
+    a: int
+
+def func(by_key: dict[str, Model], callback: Callable[[Model], None], models: list[Model], other: Model | int):
+    for key in by_key:
+        copy.deepcopy(key)
+        copy.deepcopy(by_key)
+        copy.deepcopy(callback)
+        copy.deepcopy(models)
+        copy.deepcopy(other)
+"""
+
+PYD110_DEEPCOPY_WALRUS = """
+class Model(BaseModel):
+    a: int
+
+def func(values):
+    if (model := Model(a=0)) is not None:
+        for _ in values:
+            deepcopy(model)
+"""
+
+PYD110_DEEPCOPY_REASSIGNED = """
+class Model(BaseModel):
+    a: int
+
+def func(m1: Model, m2: Model, m3: Model, m4: Model, m5: Model, values):
+    m1, n = 1, 2
+    [*m2] = values
+    with open(path) as m3:
+        pass
+    if (m4 := get_value()) is not None:
+        pass
+    for m5, _ in values:
+        pass
+    for _ in values:
+        deepcopy(m1)
+        deepcopy(m2)
+        deepcopy(m3)
+        deepcopy(m4)
+        deepcopy(m5)
+"""
+
+PYD110_OK = """
+class Model(BaseModel):
+    a: int
+
+model = Model(a=1)
+
+def func(items, model: Model):
+    model.model_copy(deep=True)
+    deepcopy(model)
+    for item in items:
+        item.model_copy(update={"a": 1})
+        deepcopy(item)
+        model = other()
+        deepcopy(model)
+
+    def nested():
+        for _ in items:
+            deepcopy(model)
+"""
+
+
+@pytest.mark.parametrize(
+    ["source", "expected"],
+    [
+        (PYD110_MODEL_COPY, [PYD110(4, 8)]),
+        (PYD110_DEEPCOPY_PARAMETER, [PYD110(6, 12)]),
+        (PYD110_DEEPCOPY_INSTANCE, [PYD110(9, 8), PYD110(10, 8), PYD110(11, 8)]),
+        (PYD110_DEEPCOPY_OPTIONAL, [PYD110(7, 8), PYD110(8, 8), PYD110(9, 8)]),
+        (PYD110_DEEPCOPY_NOT_INSTANCE, []),
+        (PYD110_DEEPCOPY_WALRUS, [PYD110(8, 12)]),
+        (PYD110_DEEPCOPY_REASSIGNED, []),
+        (PYD110_OK, []),
+    ],
+)
+def test_pyd110(source: str, expected: list[Error]) -> None:
+    module = ast.parse(source)
+    visitor = Visitor()
+    visitor.visit(module)
+
+    assert visitor.errors == expected
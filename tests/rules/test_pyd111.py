@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import ast
+
+import pytest
+
+from flake8_pydantic.errors import PYD111, Error
+from flake8_pydantic.options import Options
+from flake8_pydantic.visitor import Visitor
+
+RECOMPUTED = "recomputed on every access and serialization"
+
+PYD111_PROPERTY = """
+class Model(BaseModel):
+    items: list[Item]
+
+    @computed_field
+    @property
+    def total(self) -> int:
+        return sum(item.price for item in self.items)
+"""
+
+PYD111_LOOP = """
+class Model(BaseModel):
+    items: list[Item]
+
+    @computed_field
+    def total(self) -> int:
+        total = 0
+        for item in self.items:
+            total += item.get_price()
+        return total
+"""
+
+PYD111_PLAIN_LOOP = """
+class Model(BaseModel):
+    items: list[Item]
+
+    @computed_field
+    @property
+    def total(self) -> int:
+        total = 0
+        for item in self.items:
+            total += item.price
+        return total
+"""
+
+PYD111_CACHED_NOT_FROZEN = """
+class Model(BaseModel):
+    items: list[Item]
+
+    @computed_field
+    @functools.cached_property
+    def total(self) -> int:
+        return sum(item.price for item in self.items)
+"""
+
+PYD111_CACHED_FROZEN = """
+class Model(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    items: list[Item]
+
+    @computed_field
+    @cached_property
+    def total(self) -> int:
+        return sum(item.price for item in self.items)
+"""
+
+PYD111_SIMPLE = """
+class Model(BaseModel):
+    first_name: str
+    last_name: str
+
+    @computed_field
+    @property
+    def full_name(self) -> str:
+        return f"{self.first_name} {self.last_name}"
+
+    @computed_field
+    @property
+    def upper_name(self) -> str:
+        return self.first_name.upper()
+"""
+
+
+@pytest.mark.parametrize(
+    ["source", "expected"],
+    [
+        (PYD111_PROPERTY, [PYD111(7, 4, RECOMPUTED)]),
+        (PYD111_LOOP, [PYD111(6, 4, RECOMPUTED)]),
+        (PYD111_PLAIN_LOOP, [PYD111(7, 4, RECOMPUTED)]),
+        (
+            PYD111_CACHED_NOT_FROZEN,
+            [PYD111(7, 4, "cached on a model that isn't frozen, the cached value can become stale")],
+        ),
+        (PYD111_CACHED_FROZEN, []),
+        (PYD111_SIMPLE, []),
+    ],
+)
+def test_pyd111(source: str, expected: list[Error]) -> None:
+    module = ast.parse(source)
+    visitor = Visitor()
+    visitor.visit(module)
+
+    assert visitor.errors == expected
+
+
+def test_pyd111_max_complexity() -> None:
+    module = ast.parse(PYD111_PROPERTY)
+    visitor = Visitor(Options(max_computed_field_complexity=3))
+    visitor.visit(module)
+
+    assert visitor.errors == []
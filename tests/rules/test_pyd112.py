@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import ast
+
+import pytest
+
+from flake8_pydantic.errors import PYD112, Error
+from flake8_pydantic.options import Options
+from flake8_pydantic.visitor import Visitor
+
+PYD112_BARE = """
+@dataclass
+class Model:
+    a: int
+"""
+
+PYD112_CALL = """
+@pydantic.dataclasses.dataclass(frozen=True)
+class Model:
+    a: int
+"""
+
+PYD112_SLOTS_FALSE = """
+@pydantic_dataclass(slots=False)
+class Model:
+    a: int
+"""
+
+PYD112_SLOTS = """
+@dataclass(frozen=True, slots=True)
+class Model:
+    a: int
+"""
+
+PYD112_SLOTS_ATTRIBUTE = """
+@dataclass
+class Model:
+    __slots__ = ("a",)
+
+    a: int
+"""
+
+PYD112_MODEL = """
+class Model(BaseModel):
+    a: int
+"""
+
+
+@pytest.mark.parametrize(
+    ["source", "expected"],
+    [
+        (PYD112_BARE, [PYD112(3, 0)]),
+        (PYD112_CALL, [PYD112(3, 0)]),
+        (PYD112_SLOTS_FALSE, [PYD112(3, 0)]),
+        (PYD112_SLOTS, []),
+        (PYD112_SLOTS_ATTRIBUTE, []),
+        (PYD112_MODEL, []),
+    ],
+)
+def test_pyd112(source: str, expected: list[Error]) -> None:
+    module = ast.parse(source)
+    visitor = Visitor(Options(min_python_version=(3, 10)))
+    visitor.visit(module)
+
+    assert visitor.errors == expected
+
+
+def test_pyd112_min_python_version() -> None:
+    module = ast.parse(PYD112_BARE)
+    visitor = Visitor(Options(min_python_version=(3, 9)))
+    visitor.visit(module)
+
+    assert visitor.errors == []
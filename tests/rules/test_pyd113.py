@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import ast
+
+import pytest
+
+from flake8_pydantic.errors import PYD113, Error
+from flake8_pydantic.visitor import Visitor
+
+PYD113_INSTANCE = """
+class Model(BaseModel):
+    model_config = ConfigDict(validate_assignment=True)
+
+    a: int
+
+def func(values):
+    model = Model(a=0)
+    for value in values:
+        model.a = value
+        model.a += value
+"""
+
+PYD113_ITERATED = """
+class Base(BaseModel, validate_assignment=True):
+    pass
+
+class Model(Base):
+    a: int
+
+def func(models: list[Model]):
+    for model in models:
+        model.a: int = 1
+"""
+
+PYD113_ITERATED_COLLECTIONS = """
+class Model(BaseModel, validate_assignment=True):
+    a: int
+
+def func(models: tuple[Model, ...], values):
+    others: Sequence[Model] = get_models()
+    for model in models:
+        model.a = 1
+    for other in others:
+        other.a = 1
+"""
+
+PYD113_ITERATED_NOT_COLLECTIONS = """
+class Model(BaseModel, validate_assignment=True):
+    a: int
+
+def func(model: Model, by_key: dict[str, Model], models: list[Model]):
+    for item in model:
+        item.a = 1
+    for key in by_key:
+        key.a = 1
+    models = get_values()
+    for value in models:
+        value.a = 1
+"""
+
+PYD113_SELF = """
+class Model(BaseModel):
+    model_config = ConfigDict(validate_assignment=True)
+
+    a: int
+
+    def update(self, values):
+        for value in values:
+            self.a = value
+
+    @classmethod
+    def create(cls, values):
+        for value in values:
+            cls.a = value
+
+    def nested(self):
+        def inner(self, values):
+            for value in values:
+                self.a = value
+
+class Other(BaseModel):
+    a: int
+
+    def update(self, values):
+        for value in values:
+            self.a = value
+"""
+
+PYD113_NO_VALIDATE_ASSIGNMENT = """
+class Model(BaseModel):
+    a: int
+
+def func(model: Model, values):
+    for value in values:
+        model.a = value
+"""
+
+PYD113_OUTSIDE_LOOP = """
+class Model(BaseModel):
+    model_config = {"validate_assignment": True}
+
+    a: int
+
+def func(model: Model, values):
+    model.a = 1
+    for model in values:
+        model.a = 1
+"""
+
+
+@pytest.mark.parametrize(
+    ["source", "expected"],
+    [
+        (PYD113_INSTANCE, [PYD113(10, 8), PYD113(11, 8)]),
+        (PYD113_ITERATED, [PYD113(10, 8)]),
+        (PYD113_ITERATED_COLLECTIONS, [PYD113(8, 8), PYD113(10, 8)]),
+        (PYD113_ITERATED_NOT_COLLECTIONS, []),
+        (PYD113_SELF, [PYD113(9, 12)]),
+        (PYD113_NO_VALIDATE_ASSIGNMENT, []),
+        (PYD113_OUTSIDE_LOOP, []),
+    ],
+)
+def test_pyd113(source: str, expected: list[Error]) -> None:
+    module = ast.parse(source)
+    visitor = Visitor()
+    visitor.visit(module)
+
+    assert visitor.errors == expected
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import ast
+from itertools import count
+from pathlib import Path
+
+import pytest
+
+from flake8_pydantic.plugin import Plugin
+
+from .conftest import ParseOptions
+
+GIANT_CLASS_BODY = "class Model(BaseModel):\n" + "    a: int = Field(1)\n" * 1_000
+
+# With a budget of 100 clock reads, the giant class body is abandoned shortly after the deadline:
+GIANT_CLASS_BODY_BUDGET = 100
+GIANT_CLASS_BODY_MAX_CLOCK_READS = 110
+
+DEEP_ANNOTATION = "class Model(BaseModel):\n    a: " + " | ".join(["int"] * 2_000) + "\n"
+
+
+def test_budget_phase(monkeypatch: pytest.MonkeyPatch, parse_options: ParseOptions) -> None:
+    # Each call to the clock takes one second:
+    clock = count()
+    monkeypatch.setattr("flake8_pydantic.visitor.time.monotonic", lambda: next(clock))
+    parse_options(max_analysis_time=1.5)
+
+    # The clock is read when the budget starts, then when entering and leaving the classification:
+    source = "class Model(BaseModel):\n    a = 1\n"
+    assert [error[2] for error in Plugin(ast.parse(source), "models.py").run()] == [
+        "PYD108 Analysis of models.py exceeded its budget during classify_class, consider excluding it",
+    ]
+
+
+def test_budget_slow_phase(monkeypatch: pytest.MonkeyPatch, parse_options: ParseOptions) -> None:
+    now = 0.0
+    monkeypatch.setattr("flake8_pydantic.visitor.time.monotonic", lambda: now)
+
+    def slow_extract_annotations(annotation: ast.expr) -> set[str]:
+        nonlocal now
+        now += 10
+        return set()
+
+    monkeypatch.setattr("flake8_pydantic.visitor.extract_annotations", slow_extract_annotations)
+    parse_options(max_analysis_time=5)
+
+    # The phase which used up the budget is blamed, not the next one:
+    source = "class Model(BaseModel):\n    a: int\n"
+    assert [error[2] for error in Plugin(ast.parse(source), "models.py").run()] == [
+        "PYD108 Analysis of models.py exceeded its budget during check_pyd_005, consider excluding it",
+    ]
+
+
+def test_budget_giant_class_body(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, parse_options: ParseOptions) -> None:
+    # Each call to the clock takes one second:
+    clock = count()
+    monkeypatch.setattr("flake8_pydantic.visitor.time.monotonic", lambda: next(clock))
+    over_budget_file = tmp_path / "over_budget.txt"
+    parse_options(max_analysis_time=GIANT_CLASS_BODY_BUDGET, over_budget_file=str(over_budget_file))
+    tree = ast.parse(GIANT_CLASS_BODY)
+
+    errors = list(Plugin(tree, "giant.py").run())
+
+    # The deadline is checked for each statement, not only when the first check of the class body ends:
+    assert next(clock) < GIANT_CLASS_BODY_MAX_CLOCK_READS
+    assert (
+        errors[-1][2] == "PYD108 Analysis of giant.py exceeded its budget during check_pyd_002, consider excluding it"
+    )
+    assert over_budget_file.read_text() == "giant.py\n"
+
+
+def test_deep_annotation() -> None:
+    errors = list(Plugin(ast.parse(DEEP_ANNOTATION), "deep.py").run())
+
+    assert [error[2].split(" during ")[0] for error in errors] == [
+        "PYD108 Analysis of deep.py exceeded its budget",
+    ]
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import ast
+from pathlib import Path
+
+import pytest
+
+from flake8_pydantic.baseline import get_fingerprints, load_baseline
+from flake8_pydantic.errors import PYD002
+from flake8_pydantic.plugin import Plugin
+from flake8_pydantic.visitor import Visitor
+
+from .conftest import ParseOptions
+
+SOURCE = """
+class Model(BaseModel):
+    a = 1
+
+class Other(BaseModel):
+    a = 1
+"""
+
+SOURCE_SHIFTED = """
+import pydantic
+
+
+class Model(BaseModel):
+    b: int
+    a = 1
+
+class Other(BaseModel):
+    a = 1
+"""
+
+SOURCE_NEW_ERROR = """
+class Model(BaseModel):
+    a = 1
+    b = 2
+
+class Other(BaseModel):
+    a = 1
+"""
+
+
+def get_errors(source: str) -> list[PYD002]:
+    visitor = Visitor()
+    visitor.visit(ast.parse(source))
+    return visitor.errors  # type: ignore[return-value]
+
+
+def test_fingerprints() -> None:
+    fingerprints = get_fingerprints(ast.parse(SOURCE), "models.py", get_errors(SOURCE))
+    shifted_fingerprints = get_fingerprints(ast.parse(SOURCE_SHIFTED), "models.py", get_errors(SOURCE_SHIFTED))
+
+    # Same statement, different enclosing class:
+    assert fingerprints[0] != fingerprints[1]
+    assert fingerprints == shifted_fingerprints
+    assert get_fingerprints(ast.parse(SOURCE), "other.py", get_errors(SOURCE)) != fingerprints
+
+
+SOURCE_FUNCTIONS = """
+def func():
+    class Model(BaseModel):
+        a = 1
+
+@validate_call
+def _helper(value: int) -> int:
+    return value
+"""
+
+SOURCE_DUPLICATE = """
+class Model(BaseModel):
+    a = 1
+    a = 1
+"""
+
+
+def test_fingerprints_python_version() -> None:
+    # Class and function definitions are fingerprinted the same way on every supported Python version:
+    tree = ast.parse(SOURCE_FUNCTIONS)
+    visitor = Visitor()
+    visitor.visit(tree)
+
+    assert get_fingerprints(tree, "models.py", visitor.errors) == [
+        "7e964189b6e74e1b",
+        "fbd84ea9a4472147",
+        "2e935259e7153512",
+    ]
+
+
+def test_fingerprints_duplicate() -> None:
+    first, second = get_fingerprints(ast.parse(SOURCE_DUPLICATE), "models.py", get_errors(SOURCE_DUPLICATE))
+
+    assert first == get_fingerprints(ast.parse(SOURCE), "models.py", get_errors(SOURCE))[0]
+    assert second != first
+
+
+def test_baseline(tmp_path: Path, parse_options: ParseOptions) -> None:
+    baseline = tmp_path / "baseline.txt"
+    baseline.write_text("existing\n")
+
+    parse_options(baseline=str(baseline), update_baseline=True)
+    # Parsing the options again (e.g. in worker processes) must not discard the recorded errors:
+    assert baseline.read_text() == "existing\n"
+    assert [error[:2] for error in Plugin(ast.parse(SOURCE), "models.py").run()] == [(3, 4), (6, 4)]
+    assert baseline.read_text().splitlines() == [
+        "existing",
+        *get_fingerprints(ast.parse(SOURCE), "models.py", get_errors(SOURCE)),
+    ]
+
+    # The baseline is loaded once per process, as in a new flake8 run:
+    load_baseline.cache_clear()
+    parse_options(baseline=str(baseline))
+    assert list(Plugin(ast.parse(SOURCE_SHIFTED), "models.py").run()) == []
+    assert [error[:3] for error in Plugin(ast.parse(SOURCE_NEW_ERROR), "models.py").run()] == [
+        (4, 4, "PYD002 Non-annotated attribute inside Pydantic model")
+    ]
+
+
+def test_update_baseline_again(tmp_path: Path, parse_options: ParseOptions) -> None:
+    baseline = tmp_path / "baseline.txt"
+    parse_options(baseline=str(baseline), update_baseline=True)
+    list(Plugin(ast.parse(SOURCE), "models.py").run())
+    content = baseline.read_text()
+
+    # Regenerating the baseline without removing it doesn't duplicate the recorded errors:
+    load_baseline.cache_clear()
+    parse_options(baseline=str(baseline), update_baseline=True)
+    list(Plugin(ast.parse(SOURCE), "models.py").run())
+    assert baseline.read_text() == content
+
+
+def test_update_baseline_requires_baseline(parse_options: ParseOptions, capsys: pytest.CaptureFixture[str]) -> None:
+    with pytest.raises(SystemExit):
+        parse_options(update_baseline=True)
+
+    assert "error: --pyd-update-baseline requires --pyd-baseline to be set" in capsys.readouterr().err
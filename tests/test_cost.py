@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import ast
+from typing import cast
+
+import pytest
+
+from flake8_pydantic.cost import ModelCost, estimate_model_cost
+
+COST_UNIONS = """
+class Model(BaseModel):
+    a: Union[int, str]
+    b: Optional[int]
+    c: list[int | str | bytes] | None
+    d: dict[str, Optional[Union[int, str]]]
+"""
+
+COST_NESTED_MODELS = """
+class Model(BaseModel):
+    a: Other
+    b: list["Other"]
+    c: Model | None
+"""
+
+
+@pytest.mark.parametrize(
+    ["source", "expected"],
+    [
+        (COST_UNIONS, ModelCost(name="Model", lineno=2, fields=4, union_members=7)),
+        (COST_NESTED_MODELS, ModelCost(name="Model", lineno=2, fields=3, nested_models=2)),
+    ],
+)
+def test_estimate_model_cost(source: str, expected: ModelCost) -> None:
+    class_def = cast(ast.ClassDef, ast.parse(source).body[0])
+    assert estimate_model_cost(class_def, model_names={"Model", "Other"}, config={}) == expected
+
+
+COST_BASE = """
+class Base(BaseModel):
+    a: int
+    b: int | str
+
+    @field_validator("a")
+    def validate_a(cls, v):
+        return v
+"""
+
+COST_SUBCLASS = """
+class Model(Base):
+    b: int
+    c: str
+"""
+
+
+def test_estimate_model_cost_inheritance() -> None:
+    base_def = cast(ast.ClassDef, ast.parse(COST_BASE).body[0])
+    class_def = cast(ast.ClassDef, ast.parse(COST_SUBCLASS).body[0])
+    base_cost = estimate_model_cost(base_def, model_names={"Base"}, config={})
+
+    assert base_cost == ModelCost(name="Base", lineno=2, fields=2, union_members=2, validators=1)
+    # `b` is overridden, without a union:
+    assert estimate_model_cost(class_def, model_names={"Base"}, config={}, bases=[base_cost]) == ModelCost(
+        name="Model", lineno=2, fields=3, validators=1
+    )
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+from pathlib import Path
+
+import pytest
+from flake8.options.manager import OptionManager  # type: ignore[import-untyped]
+
+from flake8_pydantic.options import Options
+from flake8_pydantic.plugin import Plugin
+
+from .conftest import ParseOptions
+
+SOURCE = """
+class Model1(BaseModel):
+    pass
+
+class Model2(BaseModel):
+    a: int
+    b: str
+"""
+
+
+def test_parse_options(parse_options: ParseOptions) -> None:
+    parse_options(max_models_without_defer_build=1)
+
+    assert Plugin.options == Options(max_models_without_defer_build=1)
+    assert [error[2] for error in Plugin(ast.parse(SOURCE)).run()] == [
+        "PYD106 Module defines more than 1 models, consider using `ConfigDict(defer_build=True)`",
+        "PYD106 Module defines more than 1 models, consider using `ConfigDict(defer_build=True)`",
+    ]
+
+
+def test_model_costs_file(tmp_path: Path, parse_options: ParseOptions) -> None:
+    model_costs_file = tmp_path / "costs.jsonl"
+    parse_options(model_costs_file=str(model_costs_file))
+
+    list(Plugin(ast.parse(SOURCE), "models.py").run())
+    list(Plugin(ast.parse(SOURCE), "other_models.py").run())
+
+    costs = [json.loads(line) for line in model_costs_file.read_text().splitlines()]
+    assert [(cost["filename"], cost["name"], cost["score"]) for cost in costs] == [
+        ("models.py", "Model1", 0),
+        ("models.py", "Model2", 2),
+        ("other_models.py", "Model1", 0),
+        ("other_models.py", "Model2", 2),
+    ]
+
+
+def test_min_python_version(parse_options: ParseOptions) -> None:
+    parse_options(min_python_version=(3, 12))
+
+    assert Plugin.options.min_python_version == (3, 12)
+
+
+@pytest.mark.parametrize("value", ["3.12", "3.12.1", " 3.12"])
+def test_parse_min_python_version(option_manager: OptionManager, value: str) -> None:
+    options = option_manager.parse_args(["--pyd-min-python-version", value])
+    assert options.pyd_min_python_version == (3, 12)
+
+    # Values from the configuration are set as defaults:
+    options = option_manager.parse_args([], argparse.Namespace(pyd_min_python_version=value))
+    assert options.pyd_min_python_version == (3, 12)
+
+
+@pytest.mark.parametrize("value", ["3", "3.x", "python3.10", ""])
+def test_invalid_min_python_version(
+    option_manager: OptionManager, value: str, capsys: pytest.CaptureFixture[str]
+) -> None:
+    with pytest.raises(SystemExit):
+        option_manager.parse_args(["--pyd-min-python-version", value])
+
+    assert (
+        "error: argument --pyd-min-python-version: expected a Python version such as '3.10'" in capsys.readouterr().err
+    )